@@ -5,6 +5,7 @@ AI-Powered Resume Builder with Smart Tailoring
 
 import streamlit as st
 from style import local_css, inject_custom_components
+from utils.pdf_renderer import start_pdf_workers
 
 # Page configuration
 st.set_page_config(
@@ -18,6 +19,13 @@ st.set_page_config(
 local_css("style.css")
 inject_custom_components()
 
+# Spawn and warm the PDF workers once per server process, before any download
+@st.cache_resource(show_spinner=False)
+def warm_pdf_workers():
+    return start_pdf_workers()
+
+warm_pdf_workers()
+
 # Sidebar Navigation
 with st.sidebar:
     # Logo and title
@@ -0,0 +1,101 @@
+"""
+Benchmark: bulk URL ingestion against a local fixture server.
+
+Serves a sample job posting from a throwaway HTTP server on two host names
+(127.0.0.1 and localhost) with an artificial response delay, then compares
+fetching every URL one by one with ingest_urls(), then re-runs the bulk
+ingest from the page cache. The cache is pointed at a temporary directory,
+so nothing is read from or written to data/cache.
+
+Usage:
+    python benchmarks/bench_bulk_ingest.py [--urls 40] [--delay 0.2] [--per-host 4] [--rate 0]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils import http_cache
+from utils.bulk_ingest import ingest_urls, summarize
+from utils.url_extractor import extract_job_text
+
+POSTING_HTML = """<html><head><title>Backend Engineer</title></head><body>
+<nav>Home | Jobs | About</nav>
+<article><h1>Backend Engineer (Job {n})</h1>
+<p>We are looking for a backend engineer to design and build the services behind our data platform.
+You will work with Python, PostgreSQL and Docker, and own APIs end to end.</p>
+<h2>Requirements</h2>
+<ul><li>3+ years of Python</li><li>Experience with SQL databases and REST APIs</li>
+<li>Familiarity with Docker and CI/CD</li></ul>
+<h2>Nice to have</h2><ul><li>Kubernetes</li><li>AWS</li></ul>
+</article><footer>All rights reserved</footer></body></html>"""
+
+
+def start_server(delay):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            body = POSTING_HTML.format(n=self.path.rsplit('/', 1)[-1]).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--urls', type=int, default=40)
+    parser.add_argument('--delay', type=float, default=0.2, help="Server response delay in seconds")
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=0.0, help="Requests per second per host (0 = unlimited)")
+    args = parser.parse_args()
+
+    server = start_server(args.delay)
+    port = server.server_address[1]
+    hosts = ['127.0.0.1', 'localhost']
+    urls = [f"http://{hosts[i % 2]}:{port}/jobs/{i}" for i in range(args.urls)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        http_cache.HTTP_CACHE.directory = cache_dir
+
+        start = time.perf_counter()
+        sequential = [extract_job_text(url, use_cache=False) for url in urls]
+        sequential_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [r for _, r in ingest_urls(urls, max_workers=args.workers, per_host=args.per_host,
+                                             per_host_rate=args.rate)]
+        bulk_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = [r for _, r in ingest_urls(urls, max_workers=args.workers)]
+        cached_seconds = time.perf_counter() - start
+    server.shutdown()
+
+    report = summarize(results)
+    print(f"URLs: {args.urls} on {len(hosts)} hosts, {args.delay * 1000:.0f} ms server delay")
+    print(f"Sequential:  {sequential_seconds:6.2f} s ({sum(r['success'] for r in sequential)} ok)")
+    print(f"ingest_urls: {bulk_seconds:6.2f} s ({report['ok']} ok, {report['failed']} failed, "
+          f"per_host={args.per_host}, rate={args.rate or 'unlimited'})")
+    print(f"Speedup:     {sequential_seconds / bulk_seconds:.1f}x")
+    print(f"Re-run from cache: {cached_seconds:6.2f} s "
+          f"({summarize(cached)['cached']} cached)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: HTML resume render time per resume.
+
+Usage:
+    python benchmarks/bench_html_render.py [--runs 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.html_resume_builder import create_html_resume
+
+PROFILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'user_profile.json')
+
+SAMPLE_JD_ANALYSIS = {
+    'role_type': 'Machine Learning Engineer',
+    'required_skills': ['python', 'pandas', 'numpy', 'react', 'sql'],
+    'nice_to_have_skills': ['docker', 'aws'],
+    'keywords': ['machine learning', 'data', 'api']
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(PROFILE_PATH, 'r', encoding='utf-8') as f:
+        profile = json.load(f)
+
+    match_details = {'matched_skills': ['python', 'pandas', 'numpy', 'react']}
+    render_args = (profile, SAMPLE_JD_ANALYSIS, profile['personal'].get('summary', ''),
+                   match_details, profile.get('projects', [])[:3], profile.get('experience', []))
+
+    create_html_resume(*render_args)  # Warm-up
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        create_html_resume(*render_args)
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    mean_ms = sum(timings) / len(timings) * 1000
+    p50_ms = timings[len(timings) // 2] * 1000
+    p95_ms = timings[int(len(timings) * 0.95)] * 1000
+    print(f"create_html_resume: {args.runs} runs")
+    print(f"  mean {mean_ms:.3f} ms | p50 {p50_ms:.3f} ms | p95 {p95_ms:.3f} ms")
+    print(f"  ~{1000 / mean_ms:,.0f} resumes/second")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: fast-path job extractors vs. generic trafilatura extraction.
+
+Builds a heavy synthetic posting page (large nav/footer, many unrelated
+blocks) in two flavours: with a JSON-LD JobPosting and as a Greenhouse-style
+page, and times run_extractors() against trafilatura.extract(no_fallback=False).
+
+Usage:
+    python benchmarks/bench_job_extractors.py [--runs 50] [--filler 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import trafilatura
+
+from utils.job_extractors import run_extractors
+
+DESCRIPTION = (
+    "<p>We are hiring a backend engineer to build the services behind our data platform.</p>"
+    "<h3>Requirements</h3><ul><li>3+ years of Python</li><li>SQL and REST APIs</li>"
+    "<li>Docker and CI/CD</li></ul><h3>Nice to have</h3><ul><li>Kubernetes</li><li>AWS</li></ul>"
+)
+
+
+def build_pages(filler):
+    noise = ''.join(f'<div class="card"><a href="/jobs/{i}">Other job {i}</a><p>Teaser text {i}</p></div>'
+                    for i in range(filler))
+    posting = {'@context': 'https://schema.org', '@type': 'JobPosting', 'title': 'Backend Engineer',
+               'hiringOrganization': {'@type': 'Organization', 'name': 'Acme'}, 'description': DESCRIPTION}
+    json_ld = (f'<html><head><script type="application/ld+json">{json.dumps(posting)}</script></head>'
+               f'<body><nav>{noise}</nav><article><h1>Backend Engineer</h1>{DESCRIPTION}</article></body></html>')
+    greenhouse = (f'<html><body><nav>{noise}</nav><div id="app_body"><h1 class="app-title">Backend Engineer</h1>'
+                  f'<div id="content">{DESCRIPTION}</div></div></body></html>')
+    return [('json-ld', json_ld, 'https://example.com/careers/123'),
+            ('greenhouse', greenhouse, 'https://boards.greenhouse.io/acme/jobs/123')]
+
+
+def time_it(func, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=50)
+    parser.add_argument('--filler', type=int, default=2000, help="Unrelated blocks on the page")
+    args = parser.parse_args()
+
+    for name, html, url in build_pages(args.filler):
+        fast = run_extractors(html, url)
+        assert fast['extractor'] == name, fast
+        fast_ms = time_it(lambda: run_extractors(html, url), args.runs)
+        slow_ms = time_it(lambda: trafilatura.extract(html, include_comments=False, include_tables=True,
+                                                      no_fallback=False), args.runs)
+        print(f"{name:<11} page {len(html) / 1024:7.0f} KB | fast path {fast_ms:8.2f} ms | "
+              f"trafilatura {slow_ms:8.2f} ms | {slow_ms / fast_ms:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: bullet keyword scoring, compiled matcher vs the old per-keyword loop.
+
+Synthetic bullets are dense with keywords (several hits each); --profile
+scores the real bullets of data/user_profile.json instead. Building the
+matcher is timed separately: optimize_experience_bullets gets it from the
+lru-cached get_keyword_matcher, so it is built once per keyword list.
+
+Usage:
+    python benchmarks/bench_keyword_matching.py [--experiences 20] [--bullets 25] [--keywords 40] [--profile]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.keyword_matcher import KeywordMatcher
+
+PROFILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'user_profile.json')
+
+VOCABULARY = [
+    'Python', 'Go', 'Java', 'Kubernetes', 'Docker', 'AWS', 'React', 'Node.js', 'SQL', 'PostgreSQL',
+    'machine learning', 'data pipelines', 'REST APIs', 'microservices', 'CI/CD', 'Terraform', 'Kafka',
+    'Spark', 'C++', 'TypeScript', 'GraphQL', 'Redis', 'monitoring', 'latency', 'scalability', 'testing'
+]
+FILLER = [
+    'led', 'a', 'good', 'team', 'to', 'build', 'and', 'ship', 'reliable', 'services', 'improving',
+    'throughput', 'by', '30%', 'across', 'multiple', 'regions', 'with', 'ongoing', 'ownership'
+]
+
+
+def legacy_score(resp, jd_keywords):
+    resp_lower = resp.lower()
+    return sum(1 for keyword in jd_keywords if keyword.lower() in resp_lower)
+
+
+def make_bullets(count, rng):
+    return [' '.join(rng.choice(VOCABULARY + FILLER * 3) for _ in range(rng.randint(12, 30)))
+            for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--experiences', type=int, default=20)
+    parser.add_argument('--bullets', type=int, default=25)
+    parser.add_argument('--keywords', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--profile', action='store_true', help="Score the bullets of data/user_profile.json")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # JD keywords are distinct; past the vocabulary, pad with terms that never occur in bullets
+    keywords = rng.sample(VOCABULARY, min(args.keywords, len(VOCABULARY)))
+    keywords += [f'tool{i}' for i in range(len(keywords), args.keywords)]
+    if args.profile:
+        with open(PROFILE_PATH, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+        bullets = [r for exp in profile.get('experience', []) for r in exp.get('responsibilities', [])]
+        bullets += [proj.get('description', '') for proj in profile.get('projects', [])]
+        # Same number of bullets as the synthetic run, cycling through the real ones
+        experiences = [[bullets[(i * args.bullets + j) % len(bullets)] for j in range(args.bullets)]
+                       for i in range(args.experiences)]
+    else:
+        experiences = [make_bullets(args.bullets, rng) for _ in range(args.experiences)]
+    total_bullets = args.experiences * args.bullets
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for bullets in experiences:
+            for resp in bullets:
+                legacy_score(resp, keywords)
+    legacy = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        matcher = KeywordMatcher(keywords)
+    build = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for bullets in experiences:
+            for resp in bullets:
+                matcher.score(resp)
+    compiled = (time.perf_counter() - start) / args.repeat
+
+    print(f"{total_bullets} {'profile' if args.profile else 'synthetic'} bullets x {args.keywords} keywords")
+    print(f"  legacy loop:      {legacy * 1000:8.2f} ms per profile")
+    print(f"  compiled matcher: {compiled * 1000:8.2f} ms per profile ({legacy / compiled:.1f}x), "
+          f"built once in {build * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
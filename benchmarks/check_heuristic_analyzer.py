@@ -0,0 +1,55 @@
+"""
+Check: the offline JD analyzer puts skills in the right list.
+
+Each case is a job description with the exact required and nice-to-have
+skills analyze_job_description_offline() must report. An optional marker
+("a plus", "ideally", "familiarity") only moves the skills in its own
+clause, so a requirements line never ends up with an empty required list
+(which would hand every candidate the full required-skill score).
+
+Run it after changing the section, clause or skill rules in
+utils/heuristic_analyzer.py; it exits 1 on any failure.
+
+Usage:
+    python benchmarks/check_heuristic_analyzer.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.heuristic_analyzer import analyze_job_description_offline
+
+# (job description, required skills, nice-to-have skills)
+CASES = [
+    ("You have 5 years of Python and SQL experience. Kafka is a plus.", ['Python', 'SQL'], ['Kafka']),
+    ("- Python, SQL and Docker; familiarity with Kafka", ['Python', 'SQL', 'Docker'], ['Kafka']),
+    ("strong Python and SQL skills, ideally some Kafka", ['Python', 'SQL'], ['Kafka']),
+    ("Requirements\n- Python and SQL, ideally some Kafka\n- Docker", ['Python', 'SQL', 'Docker'], ['Kafka']),
+    ("Requirements\n- Experience with React.js; Node.js preferred", ['React.js'], ['Node.js']),
+    ("Requirements\n- Ideally Go or C++.\n- Java", ['Java'], ['Go', 'C++']),
+    ("Requirements\n- Python\nNice to have\n- Kubernetes, AWS", ['Python'], ['Kubernetes', 'AWS']),
+    ("Requirements\n- Work with the rest of the team to express ideas and spark collaboration\n- Python",
+     ['Python'], []),
+]
+
+
+def main():
+    failed = 0
+    for jd_text, required, nice in CASES:
+        analysis = analyze_job_description_offline(jd_text)
+        got = (analysis['required_skills'], analysis['nice_to_have_skills'])
+        ok = got == (required, nice)
+        print(f"{'✅' if ok else '❌'} {' / '.join(jd_text.splitlines())!r}")
+        if not ok:
+            print(f"    expected required={required} nice={nice}")
+            print(f"    got      required={got[0]} nice={got[1]}")
+        failed += not ok
+
+    print(f"{len(CASES) - failed}/{len(CASES)} cases passed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Check: JD compaction keeps what the analysis needs.
+
+Each case is a job description with the lines that must reach the model
+verbatim (requirement sentences, headings, requirement lines that happen
+to mention cookies or background checks) and the lines that should be
+cut (benefits, EEO text, cookie banners). On top of that, the offline
+analyzer must find the same required and nice-to-have skills in the
+compacted text as in the original, so a heading misread or dropped by
+compaction shows up as a skill moving between the two lists or
+disappearing.
+
+Run it after changing the heading rules in utils/heuristic_analyzer.py or
+the boilerplate rules in utils/jd_compactor.py; it exits 1 on any failure.
+
+Usage:
+    python benchmarks/check_jd_compaction.py [--verbose]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.heuristic_analyzer import analyze_job_description_offline
+from utils.jd_compactor import compact_jd
+
+CASES = [
+    {
+        'name': 'sentence requirements under a plain heading',
+        'jd': """Backend Engineer
+About the role
+We are looking for a backend engineer to join our platform team and help us scale.
+Requirements
+You have 5+ years of Python experience
+You will build APIs in Python and Go.
+Strong SQL skills
+Experience with React.js front ends is helpful
+Nice to have
+- Kubernetes
+- AWS
+Responsibilities
+- Design and operate backend services
+- Work with the rest of the team to express ideas and spark collaboration
+Benefits
+- Health insurance
+We are an equal opportunity employer.""",
+        'keep': ['Requirements', 'You have 5+ years of Python experience', 'You will build APIs in Python and Go.',
+                 'Strong SQL skills', 'Nice to have', '- Kubernetes'],
+        'drop': ['- Health insurance', 'We are an equal opportunity employer.']
+    },
+    {
+        'name': 'styled headings and inline labels',
+        'jd': """## What You'll Do
+- Build data pipelines in Spark and Airflow
+**Qualifications:**
+- 3+ years with Scala or Java
+Bonus points: Kafka, Terraform
+PERKS & BENEFITS
+- Free lunch""",
+        'keep': ["## What You'll Do", '**Qualifications:**', '- 3+ years with Scala or Java',
+                 'Bonus points: Kafka, Terraform'],
+        'drop': ['- Free lunch']
+    },
+    {
+        'name': 'heading-like lines with no content under them',
+        'jd': """Data Engineer
+Must Have Strong Communication Skills
+Preferred Qualifications
+Requirements
+- Python and SQL
+Preferred skills include Airflow and dbt""",
+        'keep': ['Must Have Strong Communication Skills', 'Preferred Qualifications', '- Python and SQL',
+                 'Preferred skills include Airflow and dbt'],
+        'drop': []
+    },
+    {
+        'name': 'requirement lines that mention legal or web terms',
+        'jd': """Backend Engineer
+Requirements
+- 3+ years of Python and PostgreSQL; offer contingent on a background check
+- Comfortable with being on call; we share on-call duties across the team
+- Experience with HTTP caching, cookies and session management in Django
+- Kubernetes
+Responsibilities
+- Keep our privacy policy tooling compliant with GDPR""",
+        'keep': ['- 3+ years of Python and PostgreSQL; offer contingent on a background check',
+                 '- Comfortable with being on call; we share on-call duties across the team',
+                 '- Experience with HTTP caching, cookies and session management in Django',
+                 '- Keep our privacy policy tooling compliant with GDPR'],
+        'drop': []
+    },
+    {
+        'name': 'legal and page boilerplate outside the content sections',
+        'jd': """Platform Engineer at Acme. Share this job with a friend who knows Go.
+We use cookies to improve your experience.
+Acme is an equal opportunity employer.
+All qualified applicants will receive consideration without regard to race, color or religion.
+Offers of employment are contingent upon a background check.
+Requirements
+- Go and Terraform""",
+        'keep': ['Platform Engineer at Acme. Share this job with a friend who knows Go.', '- Go and Terraform'],
+        'drop': ['We use cookies to improve your experience.', 'Acme is an equal opportunity employer.',
+                 'All qualified applicants will receive consideration without regard to race, color or religion.',
+                 'Offers of employment are contingent upon a background check.']
+    },
+    {
+        'name': 'repeated lines and a posting with no headings',
+        'jd': """Senior Frontend Developer working with React and TypeScript.
+You will own our design system and work closely with designers.
+Senior Frontend Developer working with React and TypeScript.
+Apply now to join us!""",
+        'keep': ['You will own our design system and work closely with designers.'],
+        'drop': ['Apply now to join us!']
+    }
+]
+
+
+def _skills(jd_text):
+    analysis = analyze_job_description_offline(jd_text)
+    return analysis['required_skills'], analysis['nice_to_have_skills']
+
+
+def check_case(case):
+    """Returns: (compaction result, list of failure messages)"""
+    result = compact_jd(case['jd'])
+    lines = set(result['text'].splitlines())
+    failures = [f"dropped {line!r}" for line in case['keep'] if line not in lines]
+    failures += [f"kept {line!r}" for line in case['drop'] if line in lines]
+
+    (required, nice), (compact_required, compact_nice) = _skills(case['jd']), _skills(result['text'])
+    if compact_required != required:
+        failures.append(f"required skills {required} -> {compact_required}")
+    if compact_nice != nice:
+        failures.append(f"nice-to-have skills {nice} -> {compact_nice}")
+    return result, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--verbose', action='store_true', help="Print the compacted text of every case")
+    args = parser.parse_args()
+
+    failed = 0
+    for case in CASES:
+        result, failures = check_case(case)
+        status = '❌' if failures else '✅'
+        print(f"{status} {case['name']}: {result['original_tokens']} -> {result['compacted_tokens']} tokens")
+        for failure in failures:
+            print(f"    {failure}")
+        if args.verbose:
+            print('    ' + result['text'].replace('\n', '\n    '))
+        failed += bool(failures)
+
+    print(f"{len(CASES) - failed}/{len(CASES)} cases passed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Check: a failing LLM upstream is retried by utils/resilience.py only, and
+never past a call's deadline.
+
+Points the pooled Cerebras client (CEREBRAS_BASE_URL) at a throwaway HTTP
+server that answers every request with 503 and counts the requests it saw:
+
+- one uncached analyze_job_description(fallback=False): the SDK must not
+  retry on its own, so the chat endpoint is hit exactly
+  ANALYSIS_ENDPOINT.max_attempts times and the TCP warm-up at most once
+- one generate_tailored_summary() with the server answering slower than
+  the summary deadline (RESUMEFORGE_SUMMARY_TIMEOUT, 2s here): the first
+  attempt uses up the deadline, so there is no retry and the call returns
+  the fallback within the deadline
+
+Exits 1 on any failure.
+
+Usage:
+    python benchmarks/check_llm_retries.py [--status 503]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+JD_TEXT = """Backend Engineer
+Requirements
+- 3+ years of Python and SQL
+- Docker and Kubernetes"""
+
+SUMMARY_DEADLINE = 2.0
+# Seconds the fixture waits before answering a chat request in the slow check
+SLOW_RESPONSE = 3.0
+PROFILE = {'personal': {'name': 'Sam', 'summary': 'Backend engineer.'}, 'skills': {'languages': ['Python']}}
+JD_ANALYSIS = {'required_skills': ['Python'], 'nice_to_have_skills': [], 'role_type': 'Backend Engineer',
+               'seniority_level': 'Mid-Level', 'key_responsibilities': [], 'keywords': ['Python']}
+
+
+def start_server(status, requests_seen, delay):
+    class Handler(BaseHTTPRequestHandler):
+        def _fail(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            self.rfile.read(length)
+            requests_seen[self.path.split('?')[0]] += 1
+            if self.path.endswith('/chat/completions'):
+                time.sleep(delay['seconds'])
+            body = b'{"error": "unavailable"}'
+            try:
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # The client timed out first
+
+        do_GET = do_POST = _fail
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _chat_requests(requests_seen):
+    return sum(n for path, n in requests_seen.items() if path.endswith('/chat/completions'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--status', type=int, default=503, help="Status every request gets (default: %(default)s)")
+    args = parser.parse_args()
+
+    requests_seen = Counter()
+    delay = {'seconds': 0.0}
+    server = start_server(args.status, requests_seen, delay)
+    os.environ['CEREBRAS_BASE_URL'] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ['CEREBRAS_API_KEY'] = 'check-llm-retries'
+    os.environ['RESUMEFORGE_SUMMARY_TIMEOUT'] = str(SUMMARY_DEADLINE)
+
+    from utils.ai_analyzer import ANALYSIS_ENDPOINT, analyze_job_description, generate_tailored_summary
+    from utils.resilience import CEREBRAS_BREAKER
+
+    result = analyze_job_description(JD_TEXT, use_cache=False, fallback=False)
+    chat_requests = _chat_requests(requests_seen)
+    warmup_requests = sum(n for path, n in requests_seen.items() if 'warm' in path)
+    print(f"Analysis result: success={result['success']}, error={result['error']}")
+    for path, count in sorted(requests_seen.items()):
+        print(f"  {path}: {count} request(s)")
+
+    # Slow upstream: the summary must give up at its deadline without a retry.
+    # Close the breaker the failures above may have counted towards first
+    CEREBRAS_BREAKER.record_success()
+    delay['seconds'] = SLOW_RESPONSE
+    start = time.perf_counter()
+    summary = generate_tailored_summary(PROFILE, JD_ANALYSIS)
+    summary_seconds = time.perf_counter() - start
+    summary_requests = _chat_requests(requests_seen) - chat_requests
+    server.shutdown()
+    print(f"Summary against a {SLOW_RESPONSE:g}s upstream: {summary_requests} request(s), "
+          f"{summary_seconds:.1f}s, returned {summary!r}")
+
+    failures = []
+    if result['success']:
+        failures.append("analysis succeeded against a failing upstream")
+    if chat_requests != ANALYSIS_ENDPOINT.max_attempts:
+        failures.append(f"{chat_requests} chat requests, expected {ANALYSIS_ENDPOINT.max_attempts} "
+                        f"(one per resilient_call attempt)")
+    if warmup_requests > 1:
+        failures.append(f"{warmup_requests} warm-up requests, expected at most 1")
+    if summary_requests != 1:
+        failures.append(f"{summary_requests} summary requests, expected 1 (no retry past the deadline)")
+    if summary_seconds > SUMMARY_DEADLINE + 1:
+        failures.append(f"summary took {summary_seconds:.1f}s, deadline is {SUMMARY_DEADLINE:g}s")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Only resilient_call retried the failing upstream, within the call deadline")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+ResumeForge AI - Headless command line entry point
+
+Examples:
+    python cli.py batch --jds postings/ --out outputs/ --workers 4
+    python cli.py rank-profiles --profiles candidates/ --jd posting.txt --top 20
+    python cli.py ingest --urls links.txt --out postings.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.pipeline import SUPPORTED_FORMATS, tailor_resume
+from utils.profile_ranker import ProfileCorpus
+
+JD_FILE_EXTENSIONS = ('.txt', '.md')
+SUMMARY_FIELDS = [
+    'jd_id', 'status', 'analysis_source', 'role_type', 'seniority_level', 'score',
+    'matched_skills', 'missing_skills', 'seconds', 'error', 'analysis_warning', 'outputs'
+]
+
+
+def load_profile(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_job_descriptions(path):
+    """
+    Read job descriptions from a directory of .txt/.md files (id = file name)
+    or a JSONL file with one {"id": ..., "text": ...} object per line.
+    Returns: list of (jd_id, jd_text)
+    """
+    jobs = []
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in JD_FILE_EXTENSIONS:
+                with open(os.path.join(path, name), 'r', encoding='utf-8') as f:
+                    jobs.append((stem, f.read()))
+        return jobs
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            jd_id = str(record.get('id') or f"jd_{line_no:05d}")
+            jd_text = record.get('text') or record.get('jd_text') or record.get('description') or ''
+            jobs.append((jd_id, jd_text))
+    return jobs
+
+
+def safe_filename(value):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', value).strip('_') or 'resume'
+
+
+def load_checkpoint(path):
+    """Latest record per JD id from a JSONL checkpoint (later lines win)"""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Partially written last line from a crashed run
+            records[record['jd_id']] = record
+    return records
+
+
+def append_checkpoint(path, record):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def process_job(profile, jd_id, jd_text, out_dir, formats, ai_summary, allow_offline_analysis=False):
+    """Worker: tailor one resume and write its files. Returns a checkpoint record."""
+    try:
+        result = tailor_resume(profile, jd_text, formats=formats, ai_summary=ai_summary,
+                               allow_offline_analysis=allow_offline_analysis)
+    except Exception as e:
+        result = {'success': False, 'error': str(e), 'files': {}}
+
+    outputs = []
+    for fmt, data in result['files'].items():
+        file_path = os.path.join(out_dir, f"resume_{safe_filename(jd_id)}.{fmt}")
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        outputs.append(file_path)
+
+    jd_analysis = result.get('jd_analysis') or {}
+    match_details = result.get('match_details') or {}
+    return {
+        'jd_id': jd_id,
+        'status': 'ok' if result['success'] else 'failed',
+        'analysis_source': result.get('analysis_source') or '',
+        'role_type': jd_analysis.get('role_type', ''),
+        'seniority_level': jd_analysis.get('seniority_level', ''),
+        'score': match_details.get('score', ''),
+        'matched_skills': ', '.join(match_details.get('matched_skills', [])),
+        'missing_skills': ', '.join(match_details.get('missing_skills', [])),
+        'seconds': result.get('seconds', ''),
+        'error': result.get('error') or '',
+        'analysis_warning': result.get('analysis_warning') or '',
+        'outputs': outputs
+    }
+
+
+def write_summary_csv(path, records):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        for record in records:
+            row = dict(record)
+            row['outputs'] = ';'.join(row.get('outputs', []))
+            writer.writerow({k: row.get(k, '') for k in SUMMARY_FIELDS})
+
+
+def run_batch(args):
+    formats = tuple(f.strip().lower() for f in args.formats.split(',') if f.strip())
+    unknown = [f for f in formats if f not in SUPPORTED_FORMATS]
+    if unknown:
+        print(f"❌ Unsupported format(s): {', '.join(unknown)}")
+        return 2
+
+    profile = load_profile(args.profile)
+    jobs = load_job_descriptions(args.jds)
+    os.makedirs(args.out, exist_ok=True)
+    checkpoint_path = args.checkpoint or os.path.join(args.out, 'checkpoint.jsonl')
+
+    # Resume: skip everything already finished (and failures unless retried)
+    done = load_checkpoint(checkpoint_path)
+    skip_statuses = {'ok'} if args.retry_failed else {'ok', 'failed'}
+    todo = [(jd_id, text) for jd_id, text in jobs
+            if done.get(jd_id, {}).get('status') not in skip_statuses]
+    print(f"📋 {len(jobs)} job descriptions, {len(jobs) - len(todo)} already done, {len(todo)} to process")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(process_job, profile, jd_id, text, args.out, formats,
+                            not args.no_ai_summary, args.allow_offline_analysis): jd_id
+            for jd_id, text in todo
+        }
+        for count, future in enumerate(as_completed(futures), start=1):
+            jd_id = futures[future]
+            try:
+                record = future.result()
+            except Exception as e:
+                # Worker process died; record it so a rerun can retry
+                record = {'jd_id': jd_id, 'status': 'failed', 'error': str(e), 'outputs': []}
+            append_checkpoint(checkpoint_path, record)
+            done[jd_id] = record
+            if record['status'] == 'ok':
+                offline = " (offline analysis)" if record.get('analysis_source') == 'heuristic' else ""
+                print(f"✅ [{count}/{len(todo)}] {jd_id}: {record['score']}% match{offline}")
+            else:
+                print(f"❌ [{count}/{len(todo)}] {jd_id}: {record['error']}")
+
+    summary_path = os.path.join(args.out, 'summary.csv')
+    ordered = [done[jd_id] for jd_id, _ in jobs if jd_id in done]
+    write_summary_csv(summary_path, ordered)
+    failed = sum(1 for r in ordered if r['status'] != 'ok')
+    print(f"🎉 Done: {len(ordered) - failed} succeeded, {failed} failed. Summary: {summary_path}")
+    return 1 if failed else 0
+
+
+def load_jd_analysis(args):
+    """JD analysis from --jd-analysis (JSON) or by analyzing --jd (text file)"""
+    if args.jd_analysis:
+        with open(args.jd_analysis, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    from utils.ai_analyzer import analyze_job_description
+
+    with open(args.jd, 'r', encoding='utf-8') as f:
+        analysis_result = analyze_job_description(f.read())
+    if not analysis_result['success']:
+        raise ValueError(f"Error analyzing job: {analysis_result['error']}")
+    return analysis_result['data']
+
+
+def run_rank_profiles(args):
+    try:
+        jd_analysis = load_jd_analysis(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 2
+
+    corpus = ProfileCorpus.from_directory(args.profiles)
+    ranked = corpus.rank(jd_analysis, top_n=args.top)
+
+    if args.json:
+        for result in ranked:
+            result.pop('profile')
+        print(json.dumps(ranked, indent=2))
+        return 0
+
+    print(f"🎯 Top {len(ranked)} of {len(corpus)} profiles for {jd_analysis.get('role_type', 'this job')}")
+    for rank, result in enumerate(ranked, start=1):
+        print(f"{rank:>3}. {result['profile_id']}: {result['score']}%")
+        print(f"     ✔️ {', '.join(result['matched_skills']) or '-'}")
+        print(f"     ⚠️ {', '.join(result['missing_skills']) or '-'}")
+    return 0
+
+
+INGEST_REPORT_FIELDS = ['url', 'status', 'source', 'extractor', 'seconds', 'error']
+
+
+def load_urls(path):
+    """One URL per line; blank lines and # comments are skipped"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def run_ingest(args):
+    from utils.bulk_ingest import ingest_urls, summarize
+
+    urls = load_urls(args.urls)
+    report_path = args.report or os.path.splitext(args.out)[0] + '_report.csv'
+    print(f"🌐 Fetching {len(urls)} URLs ({args.workers} workers, {args.per_host} per host)")
+
+    results = [None] * len(urls)
+    # Postings are written as they arrive, in the JSONL format `batch --jds` reads
+    with open(args.out, 'w', encoding='utf-8') as out:
+        stream = ingest_urls(
+            urls, max_workers=args.workers, per_host=args.per_host, per_host_rate=args.rate,
+            use_cache=not args.no_cache, offline=args.offline or None
+        )
+        for count, (index, result) in enumerate(stream, start=1):
+            results[index] = result
+            if result['success']:
+                record = {'id': f"jd_{index + 1:05d}", 'url': result['url'], 'text': result['text']}
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+                print(f"✅ [{count}/{len(urls)}] {result['url']} ({result['status']}, {result['seconds']}s)")
+            else:
+                print(f"❌ [{count}/{len(urls)}] {result['url']}: {result['error']}")
+
+    with open(report_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=INGEST_REPORT_FIELDS)
+        writer.writeheader()
+        for result in results:
+            writer.writerow({k: result.get(k, '') for k in INGEST_REPORT_FIELDS})
+
+    report = summarize(results)
+    print(f"🎉 Done: {report['ok']} fetched, {report['cached']} from cache, {report['failed']} failed. "
+          f"Postings: {args.out}, report: {report_path}")
+    return 1 if report['failed'] else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="ResumeForge AI command line tools")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    batch = subparsers.add_parser('batch', help="Tailor one profile against many job descriptions")
+    batch.add_argument('--profile', default='data/user_profile.json', help="Profile JSON (default: %(default)s)")
+    batch.add_argument('--jds', required=True, help="Directory of .txt/.md files or a JSONL file")
+    batch.add_argument('--out', default='outputs', help="Output directory (default: %(default)s)")
+    batch.add_argument('--formats', default='pdf,docx', help="Comma-separated: pdf, docx, html (default: %(default)s)")
+    batch.add_argument('--workers', type=int, default=os.cpu_count() or 2, help="Worker processes")
+    batch.add_argument('--checkpoint', help="Checkpoint JSONL (default: <out>/checkpoint.jsonl)")
+    batch.add_argument('--retry-failed', action='store_true', help="Retry JDs that failed in a previous run")
+    batch.add_argument('--no-ai-summary', action='store_true', help="Use the profile summary instead of the LLM")
+    batch.add_argument('--allow-offline-analysis', action='store_true',
+                       help="Use the heuristic analyzer when the LLM analysis fails instead of failing the JD")
+    batch.set_defaults(func=run_batch)
+
+    rank = subparsers.add_parser('rank-profiles', help="Rank a directory of profiles against one JD")
+    rank.add_argument('--profiles', required=True, help="Directory of profile JSON files")
+    jd_source = rank.add_mutually_exclusive_group(required=True)
+    jd_source.add_argument('--jd', help="Job description text file (analyzed with the LLM)")
+    jd_source.add_argument('--jd-analysis', help="Existing JD analysis JSON")
+    rank.add_argument('--top', type=int, default=10, help="Number of profiles to show (default: %(default)s)")
+    rank.add_argument('--json', action='store_true', help="Print results as JSON")
+    rank.set_defaults(func=run_rank_profiles)
+
+    ingest = subparsers.add_parser('ingest', help="Fetch and extract many job posting URLs")
+    ingest.add_argument('--urls', required=True, help="Text file with one URL per line")
+    ingest.add_argument('--out', default='postings.jsonl', help="Output JSONL for `batch --jds` (default: %(default)s)")
+    ingest.add_argument('--report', help="Per-URL status CSV (default: <out>_report.csv)")
+    ingest.add_argument('--workers', type=int, default=16, help="Concurrent fetches (default: %(default)s)")
+    ingest.add_argument('--per-host', type=int, default=2, help="Concurrent fetches per host (default: %(default)s)")
+    ingest.add_argument('--rate', type=float, default=2.0, help="Max requests per second per host (default: %(default)s)")
+    ingest.add_argument('--no-cache', action='store_true', help="Ignore the on-disk page cache")
+    ingest.add_argument('--offline', action='store_true', help="Only serve pages already in the cache")
+    ingest.set_defaults(func=run_ingest)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
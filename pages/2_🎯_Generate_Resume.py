@@ -2,6 +2,7 @@ import json
 import os
 import sys
 import base64
+from concurrent.futures import Future
 import streamlit as st
 
 # Add utils to path
@@ -10,15 +11,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.url_extractor import extract_from_url
 from utils.ai_analyzer import (
     analyze_job_description, 
-    generate_tailored_summary, 
-    calculate_match_score,
-    generate_skill_recommendations,
+    generate_resume_insights,
     select_best_projects, 
     optimize_experience_bullets
 )
 from style import local_css, inject_custom_components
-from utils.docx_builder import create_resume_docx
-from utils.html_resume_builder import create_html_resume, html_to_pdf
+from utils.skill_index import order_skills_by_match
+from utils.render_cache import render_html_cached, render_key, submit_render
+from utils.pdf_renderer import start_pdf_workers
 
 # Page configuration
 st.set_page_config(
@@ -32,6 +32,13 @@ st.set_page_config(
 local_css("style.css")
 inject_custom_components()
 
+# Spawn and warm the PDF workers once per server process, before any download
+@st.cache_resource(show_spinner=False)
+def warm_pdf_workers():
+    return start_pdf_workers()
+
+warm_pdf_workers()
+
 # Initialize session state
 def init_session_state():
     defaults = {
@@ -41,7 +48,11 @@ def init_session_state():
         'match_details': None,
         'recommendations': None,
         'selected_skills': set(),
-        'tailored_summary': ''
+        'tailored_summary': '',
+        'analysis_warning': None,
+        'compaction': None,
+        'celebrated_key': None,
+        'artifacts': {}
     }
     for key, value in defaults.items():
         if key not in st.session_state:
@@ -57,6 +68,39 @@ def load_profile():
     except:
         return None
 
+def show_download(fmt, artifact_key, render_args, prepare_label, download_label, file_name, mime, primary=False):
+    """
+    Render a download format on demand and show its download button.
+    Returns: True when the file is ready, False if rendering failed, None if not requested yet
+    """
+    artifacts = st.session_state.artifacts
+    job_key = f"{fmt}:{artifact_key}"
+    
+    if job_key not in artifacts:
+        if not st.button(prepare_label, key=f"prepare_{fmt}", use_container_width=True,
+                         type="primary" if primary else "secondary"):
+            return None
+        artifacts[job_key] = submit_render(fmt, *render_args)
+    
+    if isinstance(artifacts[job_key], Future):
+        with st.spinner(f"Generating {fmt.upper()}..."):
+            artifacts[job_key] = artifacts[job_key].result()
+    
+    data = artifacts[job_key]
+    if not data:
+        del artifacts[job_key]  # Let the user retry
+        return False
+    
+    st.download_button(
+        label=download_label,
+        data=data,
+        file_name=file_name,
+        mime=mime,
+        use_container_width=True,
+        type="primary" if primary else "secondary"
+    )
+    return True
+
 # Header
 st.markdown("""
     <div style="text-align: center;">
@@ -160,25 +204,28 @@ if not st.session_state.generated:
                 st.markdown("</div>", unsafe_allow_html=True)
                 st.stop()
             
-            st.session_state.jd_analysis = analysis_result['data']
+            # Notices are shown on the results view: anything drawn here is wiped by st.rerun()
+            st.session_state.analysis_warning = (
+                analysis_result.get('warning') if analysis_result.get('source') == 'heuristic' else None
+            )
             
-            # Calculate Match Score
-            with st.spinner("🎯 Calculating your match score..."):
-                st.session_state.match_details = calculate_match_score(
-                    profile, st.session_state.jd_analysis
-                )
+            st.session_state.compaction = analysis_result.get('compaction')
             
-            # Generate Skill Recommendations
-            with st.spinner("🤖 Analyzing skill gaps..."):
-                st.session_state.recommendations = generate_skill_recommendations(
-                    profile, st.session_state.jd_analysis
-                )
+            st.session_state.jd_analysis = analysis_result['data']
             
-            # Generate Tailored Summary
-            with st.spinner("✨ Generating tailored summary..."):
-                st.session_state.tailored_summary = generate_tailored_summary(
-                    profile, st.session_state.jd_analysis
+            # Match score and skill gaps run concurrently while the summary streams in
+            st.subheader("📝 Tailored Professional Summary")
+            summary_placeholder = st.empty()
+            with st.spinner("✨ Scoring your match and tailoring your summary..."):
+                insights = generate_resume_insights(
+                    profile, st.session_state.jd_analysis,
+                    on_summary_chunk=lambda text: summary_placeholder.info(text + " ▌")
                 )
+            summary_placeholder.info(insights['tailored_summary'])
+            
+            st.session_state.match_details = insights['match_details']
+            st.session_state.recommendations = insights['recommendations']
+            st.session_state.tailored_summary = insights['tailored_summary']
             st.markdown("</div>", unsafe_allow_html=True)
             st.session_state.selected_skills = set()
             st.rerun()
@@ -209,6 +256,15 @@ if st.session_state.generated and st.session_state.jd_analysis:
     </h1>
 """, unsafe_allow_html=True)
 
+    if st.session_state.analysis_warning:
+        st.warning("⚠️ AI analysis is unavailable right now, so a quick offline analysis was used. "
+                   f"({st.session_state.analysis_warning})")
+    
+    compaction = st.session_state.compaction
+    if compaction and compaction['tokens_saved'] > 0:
+        st.caption(f"✂️ Trimmed boilerplate before analysis: ~{compaction['tokens_saved']} of "
+                   f"{compaction['original_tokens']} tokens saved")
+
     col1, col2 = st.columns(2)
 
     with col1:
@@ -280,6 +336,19 @@ if st.session_state.generated and st.session_state.jd_analysis:
         </div>
     </div>
     """, unsafe_allow_html=True)
+    
+    # Semantic match (only present when local embeddings are installed)
+    if 'semantic_score' in match_details:
+        st.metric(
+            "🧠 Semantic Match",
+            match_details['semantic_match_percentage'],
+            help="Similarity between your skills/experience and the job requirements, "
+                 "computed with a local embedding model"
+        )
+        if match_details['related_skills']:
+            with st.expander("🔗 Related experience found for job requirements"):
+                for item in match_details['related_skills'][:15]:
+                    st.write(f"• **{item['requirement']}** ↔ {item['profile_match']} ({item['similarity']:.2f})")
 
     
     # AI SKILL RECOMMENDATIONS (Interactive and Aesthetic)
@@ -355,9 +424,10 @@ if st.session_state.generated and st.session_state.jd_analysis:
                             type="secondary", 
                             use_container_width=True):
                     profile = load_profile()
-                    st.session_state.match_details = calculate_match_score(profile, jd_analysis)
-                    st.session_state.recommendations = generate_skill_recommendations(profile, jd_analysis)
-                    st.session_state.tailored_summary = generate_tailored_summary(profile, jd_analysis)
+                    insights = generate_resume_insights(profile, jd_analysis)
+                    st.session_state.match_details = insights['match_details']
+                    st.session_state.recommendations = insights['recommendations']
+                    st.session_state.tailored_summary = insights['tailored_summary']
                     st.rerun()
     else:
         st.success("🎉 Your profile already matches this job perfectly!")
@@ -377,9 +447,7 @@ if st.session_state.generated and st.session_state.jd_analysis:
         
         st.subheader("### Skills")
         all_user_skills = profile.get('skills', {}).get('technical', [])
-        matched_skills = [s for s in all_user_skills if s.lower() in [m.lower() for m in match_details['matched_skills']]]
-        other_skills = [s for s in all_user_skills if s not in matched_skills]
-        ordered_skills = matched_skills + other_skills
+        ordered_skills, _ = order_skills_by_match(all_user_skills, match_details)
         st.write(", ".join(ordered_skills[:15]))
     
     with col_preview2:
@@ -408,13 +476,17 @@ if st.session_state.generated and st.session_state.jd_analysis:
         optimized_experiences = optimize_experience_bullets(
             profile.get('experience', []), 
             jd_keywords, 
-            max_bullets=3
+            max_bullets=3,
+            jd_analysis=jd_analysis
         )
         
-        html_resume = create_html_resume(
+        # Renders are memoized on their inputs, so reruns from widget
+        # interactions reuse the previous HTML/PDF/DOCX
+        render_args = (
             profile, jd_analysis, tailored_summary, match_details,
             selected_projects, optimized_experiences
         )
+        html_resume = render_html_cached(*render_args)
         
         st.success("✅ Resume generated successfully!")
         
@@ -424,50 +496,45 @@ if st.session_state.generated and st.session_state.jd_analysis:
         iframe_html = f'<iframe src="data:text/html;base64,{b64_html}" width="100%" height="800px" style="border: 2px solid #667eea; border-radius: 10px;"></iframe>'
         st.components.v1.html(iframe_html, height=820, scrolling=True)
         
-        # Download Options
+        # Download Options - each format is rendered only when requested,
+        # in the background, and kept for the rest of the session
         st.write("---")
         st.subheader("💾 Download Options")
         
+        artifact_key = render_key(*render_args)
+        # Drop files rendered for earlier versions of this resume
+        for job_key in [k for k in st.session_state.artifacts if not k.endswith(artifact_key)]:
+            del st.session_state.artifacts[job_key]
+        company_name = jd_analysis.get('role_type', 'job').replace(' ', '_')
+        base_filename = f"resume_{company_name}_{profile['personal']['name'].replace(' ', '_')}"
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            with st.spinner("📄 Generating PDF..."):
-                pdf_file = html_to_pdf(html_resume)
-            
-            if pdf_file:
-                company_name = jd_analysis.get('role_type', 'job').replace(' ', '_')
-                pdf_filename = f"resume_{company_name}_{profile['personal']['name'].replace(' ', '_')}.pdf"
-                
-                st.download_button(
-                    label="📄 Download Beautiful PDF",
-                    data=pdf_file,
-                    file_name=pdf_filename,
-                    mime="application/pdf",
-                    use_container_width=True,
-                    type="primary"
-                )
-            else:
+            pdf_ready = show_download(
+                'pdf', artifact_key, render_args,
+                prepare_label="📄 Prepare Beautiful PDF",
+                download_label="📄 Download Beautiful PDF",
+                file_name=f"{base_filename}.pdf",
+                mime="application/pdf",
+                primary=True
+            )
+            if pdf_ready is False:
                 st.error("PDF generation failed. Please try DOCX format.")
         
         with col2:
-            with st.spinner("📝 Generating DOCX..."):
-                docx_file = create_resume_docx(
-                    profile, jd_analysis, tailored_summary, match_details,
-                    selected_projects, optimized_experiences
-                )
-            
-            company_name = jd_analysis.get('role_type', 'job').replace(' ', '_')
-            docx_filename = f"resume_{company_name}_{profile['personal']['name'].replace(' ', '_')}.docx"
-            
-            st.download_button(
-                label="📝 Download Plain DOCX",
-                data=docx_file,
-                file_name=docx_filename,
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                use_container_width=True
+            show_download(
+                'docx', artifact_key, render_args,
+                prepare_label="📝 Prepare Plain DOCX",
+                download_label="📝 Download Plain DOCX",
+                file_name=f"{base_filename}.docx",
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             )
         
-        st.balloons()
+        # Once per generated resume, not on every rerun from the prepare buttons
+        if st.session_state.celebrated_key != artifact_key:
+            st.session_state.celebrated_key = artifact_key
+            st.balloons()
         st.success("🎉 Your tailored resume is ready! Choose your preferred format above.")
 
 # Footer
@@ -1,9 +1,70 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dotenv import load_dotenv
-import json
+
+from utils.cache import PersistentLRUCache, make_cache_key, normalize_text
+from utils.cerebras_pool import get_pooled_client
+from utils.embeddings import semantic_match_score
+from utils.heuristic_analyzer import analyze_job_description_offline
+from utils.jd_compactor import compact_jd
+from utils.json_extract import request_json
+from utils.keyword_matcher import get_keyword_matcher
+from utils.relevance import bullet_relevance, jd_query_terms, project_relevance, scale_scores, tokenize
+from utils.resilience import cerebras_endpoint, resilient_call
+from utils.skill_index import JDIndex, ProfileIndex, display_skills
 
 load_dotenv()
 
+MODEL_NAME = "llama3.1-8b"
+
+# Bump whenever the analysis prompt changes so stale cached results are not reused
+ANALYSIS_PROMPT_VERSION = "v2"
+
+# Keys every JD analysis must have (list or string), checked on each LLM reply
+ANALYSIS_SCHEMA = {
+    'required_skills': list,
+    'nice_to_have_skills': list,
+    'role_type': str,
+    'seniority_level': str,
+    'key_responsibilities': list,
+    'keywords': list
+}
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache')
+
+ANALYSIS_CACHE = PersistentLRUCache(
+    os.path.join(CACHE_DIR, 'jd_analysis.json'),
+    max_entries=int(os.getenv('RESUMEFORGE_ANALYSIS_CACHE_SIZE', '256')),
+    ttl_seconds=int(os.getenv('RESUMEFORGE_ANALYSIS_CACHE_TTL', str(7 * 24 * 3600)))
+)
+
+# Per-call timeouts (seconds) for the calls fanned out after the JD analysis
+ANALYSIS_TIMEOUT = float(os.getenv('RESUMEFORGE_ANALYSIS_TIMEOUT', '30'))
+RECOMMENDATIONS_TIMEOUT = float(os.getenv('RESUMEFORGE_RECOMMENDATIONS_TIMEOUT', '20'))
+SUMMARY_TIMEOUT = float(os.getenv('RESUMEFORGE_SUMMARY_TIMEOUT', '20'))
+
+# Retry/timeout policy per call; all share one circuit breaker and retry budget.
+# The fanned-out calls must finish within the page's wait, so their timeout is
+# a deadline for all attempts: a retry only gets the time the first one left.
+ANALYSIS_ENDPOINT = cerebras_endpoint('analysis', ANALYSIS_TIMEOUT, max_attempts=3)
+RECOMMENDATIONS_ENDPOINT = cerebras_endpoint('recommendations', RECOMMENDATIONS_TIMEOUT, max_attempts=2,
+                                             deadline=RECOMMENDATIONS_TIMEOUT)
+SUMMARY_ENDPOINT = cerebras_endpoint('summary', SUMMARY_TIMEOUT, max_attempts=2, deadline=SUMMARY_TIMEOUT)
+
+# 'llm' (default): Cerebras, falling back to the offline analyzer on failure;
+# 'offline': never call the API for JD analysis
+ANALYZER_MODE = os.getenv('RESUMEFORGE_ANALYZER', 'llm').lower()
+
+# Text relevance (BM25) is worth at most this much on top of the skill counts:
+# one required-skill match for projects, one keyword hit for bullets
+PROJECT_TEXT_WEIGHT = 3.0
+BULLET_TEXT_WEIGHT = 1.0
+
+# Shared pool for independent LLM calls. It is never shut down, so a call that
+# times out keeps running in the background instead of blocking the page.
+LLM_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='llm')
+
 try:
     from cerebras.cloud.sdk import Cerebras
     CEREBRAS_AVAILABLE = True
@@ -16,14 +77,21 @@ def get_cerebras_client():
         raise ValueError("CEREBRAS_API_KEY not found!")
     if not CEREBRAS_AVAILABLE:
         raise ImportError("Cerebras SDK not installed")
-    return Cerebras(api_key=api_key)
+    # Shared across calls and sessions so keep-alive connections are reused
+    return get_pooled_client(api_key)
 
-def analyze_job_description(jd_text):
-    """Analyze job description using Cerebras AI"""
-    try:
-        client = get_cerebras_client()
-        
-        prompt = f"""Analyze this job description and extract the following in JSON format:
+def analysis_cache_key(jd_text, model=MODEL_NAME, prompt_version=ANALYSIS_PROMPT_VERSION):
+    """Content-addressed cache key for a job description analysis"""
+    return make_cache_key(model, prompt_version, normalize_text(jd_text))
+
+def request_job_analysis(jd_text, timeout=None):
+    """
+    Single uncached analysis round trip.
+    Raises on API or parsing errors so callers can decide whether to retry.
+    """
+    client = get_cerebras_client()
+    
+    prompt = f"""Analyze this job description and extract the following in JSON format:
 
 1. required_skills: List of required technical skills (max 15)
 2. nice_to_have_skills: List of nice-to-have skills (max 10)
@@ -37,53 +105,101 @@ Job Description:
 
 Return ONLY valid JSON."""
 
-        response = client.chat.completions.create(
-            model="llama3.1-8b",
-            messages=[
-                {"role": "system", "content": "You are an expert job description analyzer. Always return valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=1000
-        )
-        
-        result_text = response.choices[0].message.content
-        
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0]
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0]
+    # Tolerates prose/fences around the JSON; a reply cut off at max_tokens
+    # is continued instead of re-running the whole analysis
+    return request_json(
+        client,
+        [
+            {"role": "system", "content": "You are an expert job description analyzer. Always return valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        expect=dict,
+        schema=ANALYSIS_SCHEMA,
+        model=MODEL_NAME,
+        temperature=0.1,
+        max_tokens=1000,
+        timeout=timeout or ANALYSIS_TIMEOUT
+    )
+
+def _offline_analysis(jd_text, reason=None):
+    # Never cached: the LLM analysis should replace it once the API is back
+    return {
+        'success': True,
+        'data': analyze_job_description_offline(jd_text),
+        'error': None,
+        'cached': False,
+        'source': 'heuristic',
+        'warning': reason
+    }
+
+def analyze_job_description(jd_text, use_cache=True, fallback=True):
+    """
+    Analyze job description using Cerebras AI (cached by normalized JD text).
+    If the key is missing or the call fails, the offline heuristic analyzer
+    answers instead (unless fallback=False); 'source' tells which one did.
+    """
+    if ANALYZER_MODE == 'offline':
+        return _offline_analysis(jd_text)
+    
+    # Benefits, EEO text and repeated lines never reach the prompt (or the cache key)
+    compaction = compact_jd(jd_text)
+    stats = {k: v for k, v in compaction.items() if k != 'text'}
+    
+    cache_key = analysis_cache_key(compaction['text'])
+    if use_cache:
+        cached = ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return {'success': True, 'data': cached, 'error': None, 'cached': True, 'source': 'llm',
+                    'compaction': stats}
+
+    try:
+        # Retries transient errors; fails fast while the circuit breaker is open
+        analysis = resilient_call(ANALYSIS_ENDPOINT, request_job_analysis, compaction['text'])
         
-        analysis = json.loads(result_text.strip())
+        if use_cache:
+            ANALYSIS_CACHE.set(cache_key, analysis)
         
-        return {'success': True, 'data': analysis, 'error': None}
+        return {'success': True, 'data': analysis, 'error': None, 'cached': False, 'source': 'llm',
+                'compaction': stats}
         
     except Exception as e:
-        return {'success': False, 'data': None, 'error': str(e)}
+        if fallback:
+            # An expired analysis of the same JD beats a heuristic one
+            stale = ANALYSIS_CACHE.get_stale(cache_key) if use_cache else None
+            if stale is not None:
+                print(f"AI analysis failed, using expired cached analysis: {e}")
+                return {'success': True, 'data': stale, 'error': None, 'cached': True,
+                        'source': 'llm', 'warning': str(e)}
+            print(f"AI analysis failed, using offline analyzer: {e}")
+            return _offline_analysis(jd_text, reason=str(e))
+        return {'success': False, 'data': None, 'error': str(e), 'cached': False, 'source': 'llm'}
 
-def generate_skill_recommendations(user_profile, jd_analysis):
+def generate_skill_recommendations(user_profile, jd_analysis, include_ai=True, profile_index=None, jd_index=None):
     """
     Recommend skills user should add to improve match score
+    include_ai=False skips the LLM call and returns only the skill gaps
     Returns: dict with recommendations
     """
-    user_skills = set()
-    user_skills.update([s.lower() for s in user_profile.get('skills', {}).get('technical', [])])
-    user_skills.update([s.lower() for s in user_profile.get('skills', {}).get('soft', [])])
-    
-    required_skills = set([s.lower() for s in jd_analysis.get('required_skills', [])])
-    nice_skills = set([s.lower() for s in jd_analysis.get('nice_to_have_skills', [])])
+    profile_index = profile_index or ProfileIndex(user_profile)
+    jd_index = jd_index or JDIndex(jd_analysis)
+    user_skills = profile_index.skills
+    required_skills = jd_index.required
+    nice_skills = jd_index.nice
     
-    # Find missing critical skills
-    critical_missing = list(required_skills - user_skills)[:5]
+    # Find missing critical skills (in the JD's own wording, not the canonical alias)
+    critical_missing = display_skills(required_skills - user_skills, jd_index)[:5]
     
     # Find missing nice-to-have skills
-    nice_missing = list(nice_skills - user_skills)[:5]
+    nice_missing = display_skills(nice_skills - user_skills, jd_index)[:5]
     
     # AI-powered recommendations
-    try:
-        client = get_cerebras_client()
+    ai_suggestions = []
+    ai_error = None
+    if include_ai:
+        try:
+            client = get_cerebras_client()
         
-        prompt = f"""Based on this job role and the candidate's profile, suggest 3-5 skills they should consider adding to their resume to improve their chances.
+            prompt = f"""Based on this job role and the candidate's profile, suggest 3-5 skills they should consider adding to their resume to improve their chances.
 
 Role: {jd_analysis.get('role_type', 'Software Engineer')}
 Required Skills: {', '.join(jd_analysis.get('required_skills', [])[:10])}
@@ -96,49 +212,51 @@ Consider:
 
 Return as a JSON array of strings (skill names only)."""
 
-        response = client.chat.completions.create(
-            model="llama3.1-8b",
-            messages=[
-                {"role": "system", "content": "You are a career advisor helping candidates improve their resumes."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=200
-        )
-        
-        result = response.choices[0].message.content.strip()
-        
-        if "```json" in result:
-            result = result.split("```json")[1].split("```")[0]
-        elif "```" in result:
-            result = result.split("```")[1].split("```")[0]
+            suggestions = resilient_call(
+                RECOMMENDATIONS_ENDPOINT,
+                request_json,
+                client,
+                [
+                    {"role": "system", "content": "You are a career advisor helping candidates improve their resumes."},
+                    {"role": "user", "content": prompt}
+                ],
+                expect=list,
+                model=MODEL_NAME,
+                temperature=0.3,
+                max_tokens=200
+            )
+            # Skill names only, even if the model returned objects
+            ai_suggestions = [
+                s if isinstance(s, str) else str(s.get('skill') or s.get('name') or '')
+                for s in suggestions if isinstance(s, (str, dict))
+            ]
+            ai_suggestions = [s for s in ai_suggestions if s]
         
-        ai_suggestions = json.loads(result)
-        
-    except:
-        ai_suggestions = []
+        except Exception as e:
+            # Skill gaps are still useful without the AI suggestions
+            print(f"AI skill suggestions unavailable: {e}")
+            ai_suggestions = []
+            ai_error = str(e)
     
     return {
         'critical_missing': critical_missing,
         'nice_to_have_missing': nice_missing,
         'ai_suggestions': ai_suggestions[:5],
+        'ai_error': ai_error,
         'has_recommendations': len(critical_missing) > 0 or len(nice_missing) > 0
     }
-def generate_tailored_summary(user_profile, jd_analysis):
-    """Generate professional summary tailored to the job, returning only the summary text."""
-    try:
-        client = get_cerebras_client()
-        
-        user_summary = user_profile.get('personal', {}).get('summary', '')
-        user_skills = user_profile.get('skills', {})
-        role_type = jd_analysis.get('role_type', 'this position')
-        required_skills = ', '.join(jd_analysis.get('required_skills', [])[:5])
-        
-        # Check if fresher (no experience)
-        is_fresher = len(user_profile.get('experience', [])) == 0
-        
-        if is_fresher:
-            prompt = f"""Write a professional summary for a FRESHER/RECENT GRADUATE resume (2-3 sentences, max 80 words).
+def _summary_messages(user_profile, jd_analysis):
+    """Build the chat messages for the tailored summary prompt"""
+    user_summary = user_profile.get('personal', {}).get('summary', '')
+    user_skills = user_profile.get('skills', {})
+    role_type = jd_analysis.get('role_type', 'this position')
+    required_skills = ', '.join(jd_analysis.get('required_skills', [])[:5])
+    
+    # Check if fresher (no experience)
+    is_fresher = len(user_profile.get('experience', [])) == 0
+    
+    if is_fresher:
+        prompt = f"""Write a professional summary for a FRESHER/RECENT GRADUATE resume (2-3 sentences, max 80 words).
 Education: {user_profile.get('education', [{}])[0].get('degree', 'Computer Science') if user_profile.get('education') else 'Computer Science'}
 Skills: {', '.join(user_skills.get('technical', [])[:10])}
 Target Role: {role_type}
@@ -151,8 +269,8 @@ Focus on:
 - Career aspirations aligned with the role
 
 Respond ONLY with the professional summary text. Do NOT include any explanations or quotes."""
-        else:
-            prompt = f"""Write a professional summary for an EXPERIENCED PROFESSIONAL resume (2-3 sentences, max 80 words).
+    else:
+        prompt = f"""Write a professional summary for an EXPERIENCED PROFESSIONAL resume (2-3 sentences, max 80 words).
 Current Summary: {user_summary}
 Skills: {', '.join(user_skills.get('technical', [])[:10])}
 Target Role: {role_type}
@@ -161,37 +279,172 @@ Key Required Skills: {required_skills}
 Make it compelling and highlight relevant experience. Focus on achievements and impact.
 
 Respond ONLY with the professional summary text. Do NOT include any explanations or quotes."""
+    
+    return [
+        {"role": "system", "content": "You are a professional resume writer. Provide ONLY the professional summary text, no extra commentary."},
+        {"role": "user", "content": prompt}
+    ]
+
+def clean_summary_text(summary_text):
+    """Post-process raw summary output from the model"""
+    summary_text = summary_text.strip()
+    
+    # Optional: Remove surrounding quotes if model adds them
+    if summary_text.startswith('"') and summary_text.endswith('"'):
+        summary_text = summary_text[1:-1].strip()
+    
+    return summary_text
+
+def generate_tailored_summary(user_profile, jd_analysis):
+    """Generate professional summary tailored to the job, returning only the summary text."""
+    try:
+        client = get_cerebras_client()
         
-        response = client.chat.completions.create(
-            model="llama3.1-8b",
-            messages=[
-                {"role": "system", "content": "You are a professional resume writer. Provide ONLY the professional summary text, no extra commentary."},
-                {"role": "user", "content": prompt}
-            ],
+        response = resilient_call(
+            SUMMARY_ENDPOINT,
+            client.chat.completions.create,
+            model=MODEL_NAME,
+            messages=_summary_messages(user_profile, jd_analysis),
             temperature=0.3,
             max_tokens=150
         )
         
-        summary_text = response.choices[0].message.content.strip()
-        
-        # Optional: Remove surrounding quotes if model adds them
-        if summary_text.startswith('"') and summary_text.endswith('"'):
-            summary_text = summary_text[1:-1].strip()
-        
-        return summary_text
+        return clean_summary_text(response.choices[0].message.content)
         
     except Exception as e:
         # Fallback to existing summary if error occurs
+        print(f"Tailored summary unavailable: {e}")
         return user_profile.get('personal', {}).get('summary', '')
 
-def calculate_match_score(user_profile, jd_analysis):
-    """Calculate match score and provide details"""
-    user_skills = set()
-    user_skills.update([s.lower() for s in user_profile.get('skills', {}).get('technical', [])])
-    user_skills.update([s.lower() for s in user_profile.get('skills', {}).get('soft', [])])
-    
-    required_skills = set([s.lower() for s in jd_analysis.get('required_skills', [])])
-    nice_skills = set([s.lower() for s in jd_analysis.get('nice_to_have_skills', [])])
+def stream_tailored_summary(user_profile, jd_analysis, timeout=None):
+    """
+    Streaming variant of generate_tailored_summary.
+    Yields raw text chunks as the model produces them; run the joined text
+    through clean_summary_text for the final summary. If the call fails
+    before any output the existing summary is yielded instead; a failure
+    mid-stream is re-raised so the caller can discard the partial text.
+    """
+    produced_output = False
+    try:
+        client = get_cerebras_client()
+        
+        # Only opening the stream is retried; a failure mid-stream is not
+        stream = resilient_call(
+            SUMMARY_ENDPOINT,
+            client.chat.completions.create,
+            model=MODEL_NAME,
+            messages=_summary_messages(user_profile, jd_analysis),
+            temperature=0.3,
+            max_tokens=150,
+            stream=True,
+            timeout=timeout
+        )
+        
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                produced_output = True
+                yield delta
+        
+    except Exception:
+        if produced_output:
+            raise
+        yield user_profile.get('personal', {}).get('summary', '')
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def _stream_summary(user_profile, jd_analysis, on_summary_chunk, timeout):
+    """Stream the summary in the calling thread, reporting the text so far"""
+    start = time.perf_counter()
+    parts = []
+    for chunk in stream_tailored_summary(user_profile, jd_analysis, timeout=timeout):
+        parts.append(chunk)
+        on_summary_chunk(''.join(parts))
+        if time.perf_counter() - start > timeout:
+            raise FutureTimeoutError()
+    return clean_summary_text(''.join(parts)), time.perf_counter() - start
+
+def generate_resume_insights(user_profile, jd_analysis,
+                             recommendations_timeout=RECOMMENDATIONS_TIMEOUT,
+                             summary_timeout=SUMMARY_TIMEOUT,
+                             on_summary_chunk=None):
+    """
+    Run the post-analysis LLM calls (skill recommendations and tailored summary)
+    concurrently, each with its own timeout. A call that times out or fails is
+    replaced by its offline fallback so the page always gets a full result.
+    If on_summary_chunk is given, the summary is streamed in the calling thread
+    and the callback receives the text generated so far after every chunk.
+    Returns: dict with match_details, recommendations, tailored_summary, timings, errors
+    """
+    start = time.perf_counter()
+    # Normalized skill sets shared by every scorer below
+    indexes = {'profile_index': ProfileIndex(user_profile), 'jd_index': JDIndex(jd_analysis)}
+    fallbacks = {
+        'recommendations': lambda: generate_skill_recommendations(user_profile, jd_analysis, include_ai=False, **indexes),
+        'tailored_summary': lambda: user_profile.get('personal', {}).get('summary', '')
+    }
+    futures = {
+        'recommendations': (
+            LLM_EXECUTOR.submit(_timed, generate_skill_recommendations, user_profile, jd_analysis, **indexes),
+            recommendations_timeout
+        )
+    }
+    if on_summary_chunk is None:
+        futures['tailored_summary'] = (
+            LLM_EXECUTOR.submit(_timed, generate_tailored_summary, user_profile, jd_analysis),
+            summary_timeout
+        )
+
+    # Scored locally while the LLM calls are in flight
+    insights = {'match_details': calculate_match_score(user_profile, jd_analysis, **indexes)}
+    timings = {}
+    errors = {}
+
+    if on_summary_chunk is not None:
+        try:
+            insights['tailored_summary'], timings['tailored_summary'] = _stream_summary(
+                user_profile, jd_analysis, on_summary_chunk, summary_timeout
+            )
+        except FutureTimeoutError:
+            errors['tailored_summary'] = f"Timed out after {summary_timeout:g}s"
+            insights['tailored_summary'] = fallbacks['tailored_summary']()
+        except Exception as e:
+            errors['tailored_summary'] = str(e)
+            insights['tailored_summary'] = fallbacks['tailored_summary']()
+
+    for name, (future, timeout) in futures.items():
+        # Timeouts are measured from the fan-out, not from when we start waiting
+        remaining = max(0.0, timeout - (time.perf_counter() - start))
+        try:
+            insights[name], timings[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            errors[name] = f"Timed out after {timeout:g}s"
+            insights[name] = fallbacks[name]()
+        except Exception as e:
+            errors[name] = str(e)
+            insights[name] = fallbacks[name]()
+
+    timings['total'] = time.perf_counter() - start
+    insights['timings'] = timings
+    insights['errors'] = errors
+    return insights
+
+def calculate_match_score(user_profile, jd_analysis, profile_index=None, jd_index=None, semantic=True):
+    """
+    Calculate match score and provide details
+    (plus semantic_score / related_skills when local embeddings are available)
+    """
+    profile_index = profile_index or ProfileIndex(user_profile)
+    jd_index = jd_index or JDIndex(jd_analysis)
+    user_skills = profile_index.skills
+    required_skills = jd_index.required
+    nice_skills = jd_index.nice
     
     matched_required = user_skills & required_skills
     matched_nice = user_skills & nice_skills
@@ -209,14 +462,29 @@ def calculate_match_score(user_profile, jd_analysis):
     
     total_score = required_score + nice_score
     
-    return {
+    result = {
         'score': round(total_score, 1),
-        'matched_skills': list(matched_required | matched_nice),
-        'missing_skills': list(missing_skills),
-        'match_percentage': f"{round(total_score)}%"
+        # Shown to the user and saved to the profile, so in the JD's wording
+        'matched_skills': display_skills(matched_required | matched_nice, jd_index),
+        'missing_skills': display_skills(missing_skills, jd_index),
+        'match_percentage': f"{round(total_score)}%",
+        # Raw -> canonical names the alias table rewrote, for inspection
+        'skill_aliases': {**profile_index.aliases, **jd_index.aliases}
     }
+    
+    # Local embeddings, only when sentence-transformers is installed
+    if semantic:
+        try:
+            semantic_details = semantic_match_score(user_profile, jd_analysis)
+        except Exception as e:
+            print(f"Semantic match failed: {e}")
+            semantic_details = None
+        if semantic_details:
+            result.update(semantic_details)
+    
+    return result
 
-def select_best_projects(user_profile, jd_analysis, max_projects=3):
+def select_best_projects(user_profile, jd_analysis, max_projects=3, profile_index=None, jd_index=None):
     """
     Intelligently select most relevant projects for the resume
     """
@@ -224,21 +492,24 @@ def select_best_projects(user_profile, jd_analysis, max_projects=3):
     if not projects:
         return []
     
-    required_skills = set([s.lower() for s in jd_analysis.get('required_skills', [])])
-    nice_skills = set([s.lower() for s in jd_analysis.get('nice_to_have_skills', [])])
-    all_jd_skills = required_skills | nice_skills
+    profile_index = profile_index or ProfileIndex(user_profile)
+    jd_index = jd_index or JDIndex(jd_analysis)
+    required_skills = jd_index.required
+    all_jd_skills = jd_index.all_skills
+    
+    # Description text relevance, best project scaled to PROJECT_TEXT_WEIGHT
+    text_scores = scale_scores(project_relevance(projects, jd_query_terms(jd_analysis)), PROJECT_TEXT_WEIGHT)
     
     # Score each project
     scored_projects = []
-    for proj in projects:
-        tech_stack = set([t.lower() for t in proj.get('tech_stack', [])])
+    for proj, tech_stack, text_score in zip(projects, profile_index.project_stacks, text_scores):
         
         # Count matching skills
         matches = len(tech_stack & all_jd_skills)
         required_matches = len(tech_stack & required_skills)
         
         # Score: required matches worth more
-        score = (required_matches * 3) + matches
+        score = (required_matches * 3) + matches + text_score
         
         scored_projects.append((proj, score))
     
@@ -246,20 +517,31 @@ def select_best_projects(user_profile, jd_analysis, max_projects=3):
     scored_projects.sort(key=lambda x: x[1], reverse=True)
     return [p[0] for p in scored_projects[:max_projects]]
 
-def optimize_experience_bullets(experiences, jd_keywords, max_bullets=3):
+def optimize_experience_bullets(experiences, jd_keywords, max_bullets=3, jd_analysis=None):
     """
     Select and optimize experience bullets for relevance
+    (jd_analysis, when given, adds its skills and responsibilities to the text query)
     """
     optimized_experiences = []
+    # One compiled whole-word matcher for all keywords, built once per keyword list
+    matcher = get_keyword_matcher(jd_keywords)
+    
+    if jd_analysis:
+        query_terms = jd_query_terms(jd_analysis)
+    else:
+        query_terms = [term for keyword in jd_keywords or [] for term in tokenize(keyword)]
+    relevance = bullet_relevance(experiences, query_terms)
+    best_relevance = max(relevance.values(), default=0)
     
     for exp in experiences:
         responsibilities = exp.get('responsibilities', [])
         
-        # Score each responsibility by keyword matches
+        # Score each responsibility by keyword matches plus text relevance
         scored_resp = []
         for resp in responsibilities:
-            resp_lower = resp.lower()
-            score = sum(1 for keyword in jd_keywords if keyword.lower() in resp_lower)
+            score = matcher.score(resp)
+            if best_relevance > 0:
+                score += BULLET_TEXT_WEIGHT * relevance.get(resp, 0) / best_relevance
             scored_resp.append((resp, score))
         
         # Sort by score and take top N
@@ -0,0 +1,125 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.ai_analyzer import ANALYSIS_CACHE, ANALYSIS_TIMEOUT, analysis_cache_key, request_job_analysis
+from utils.jd_compactor import compact_jd
+from utils.resilience import CEREBRAS_BREAKER, CircuitOpenError, Endpoint, is_rate_limited, resilient_call
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RETRIES = 4
+BASE_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class _RateLimitGate:
+    """
+    Shared pause used by all workers in a batch: once any request is rate
+    limited, every worker waits before its next request instead of piling on.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self):
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _analyze_with_backoff(jd_text, gate, max_retries):
+    # Same breaker as the interactive calls, but no shared retry budget:
+    # a batch is expected to ride out rate limits
+    endpoint = Endpoint('batch analysis', ANALYSIS_TIMEOUT, max_attempts=max_retries + 1,
+                        base_delay=BASE_BACKOFF_SECONDS, max_delay=MAX_BACKOFF_SECONDS,
+                        breaker=CEREBRAS_BREAKER)
+    attempts = 0
+
+    def before_attempt():
+        nonlocal attempts
+        gate.wait()
+        attempts += 1
+
+    def wait(error, delay):
+        if is_rate_limited(error):
+            gate.pause(delay)
+        else:
+            time.sleep(delay)
+
+    while True:
+        gate.wait()
+        try:
+            return resilient_call(endpoint, request_job_analysis, jd_text,
+                                  max_attempts=max_retries + 1 - attempts,
+                                  before_attempt=before_attempt, wait=wait), attempts
+        except CircuitOpenError as e:
+            # Upstream is down: hold every worker until the breaker lets a trial through
+            attempts += 1
+            if attempts > max_retries:
+                e.attempts = attempts
+                raise
+            gate.pause(max(CEREBRAS_BREAKER.retry_in(), BASE_BACKOFF_SECONDS))
+        except Exception as e:
+            e.attempts = attempts
+            raise
+
+
+def analyze_job_descriptions(jd_texts, max_workers=DEFAULT_MAX_WORKERS,
+                             max_retries=DEFAULT_MAX_RETRIES, use_cache=True):
+    """
+    Analyze many job descriptions with bounded concurrency.
+    Identical postings (after normalization) are analyzed once, cached ones are
+    served first. Results are yielded as they finish, as (index, result) pairs
+    in the shape returned by analyze_job_description, plus 'attempts'.
+    A failed posting yields a failed result and never stops the batch.
+    """
+    # Group indexes by compacted content so duplicates share one request
+    groups = {}
+    for index, jd_text in enumerate(jd_texts):
+        text = compact_jd(jd_text)['text']
+        key = analysis_cache_key(text)
+        groups.setdefault(key, {'text': text, 'indexes': []})['indexes'].append(index)
+
+    pending = {}
+    for key, group in groups.items():
+        cached = ANALYSIS_CACHE.get(key) if use_cache else None
+        if cached is not None:
+            result = {'success': True, 'data': cached, 'error': None, 'cached': True, 'attempts': 0}
+            for index in group['indexes']:
+                yield index, dict(result)
+        else:
+            pending[key] = group
+
+    if not pending:
+        return
+
+    gate = _RateLimitGate()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='jd-batch')
+    try:
+        futures = {
+            executor.submit(_analyze_with_backoff, group['text'], gate, max_retries): key
+            for key, group in pending.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                analysis, attempts = future.result()
+                if use_cache:
+                    ANALYSIS_CACHE.set(key, analysis)
+                result = {'success': True, 'data': analysis, 'error': None, 'cached': False, 'attempts': attempts}
+            except Exception as e:
+                result = {'success': False, 'data': None, 'error': str(e), 'cached': False,
+                          'attempts': getattr(e, 'attempts', 1)}
+            for index in pending[key]['indexes']:
+                yield index, dict(result)
+    finally:
+        # Stop queued work if the caller abandons the generator early
+        executor.shutdown(wait=False, cancel_futures=True)
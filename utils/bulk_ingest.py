@@ -0,0 +1,133 @@
+"""
+Bulk ingestion of job posting URLs.
+
+Fetches and extracts many postings concurrently on one pooled HTTP session
+(see utils/http_cache.py), with a cap on concurrent requests and a minimum
+interval between requests per host, so a list of 100 links to the same job
+board does not hammer it. Results stream back as each page finishes, and
+summarize() turns them into a per-URL status report.
+
+Everything network-facing is injectable (session, cache, limits), so it
+can be pointed at a local fixture server.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from utils.http_cache import HTTP_CACHE, get_session, normalize_url
+from utils.url_extractor import extract_job_text
+
+DEFAULT_MAX_WORKERS = 16
+# Concurrent requests and requests per second allowed against one host
+DEFAULT_PER_HOST = 2
+DEFAULT_PER_HOST_RATE = 2.0
+
+
+class HostLimiter:
+    """Per-host concurrency cap plus a minimum interval between request starts"""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, per_host_rate=DEFAULT_PER_HOST_RATE):
+        self.per_host = max(1, per_host)
+        self.interval = 1.0 / per_host_rate if per_host_rate else 0.0
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+    def _wait_turn(self, host):
+        # Reserve the next start slot for this host, then sleep until it
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start_at + self.interval
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self, url, func, *args, **kwargs):
+        host = (urlsplit(url).hostname or '').lower()
+        with self._semaphore(host):
+            self._wait_turn(host)
+            return func(*args, **kwargs)
+
+
+def _ingest_one(url, limiter, session, use_cache, offline):
+    start = time.perf_counter()
+    if not str(url).startswith(('http://', 'https://')):
+        result = {'success': False, 'text': "", 'error': "Invalid URL. Please include http:// or https://",
+                  'source': None}
+    elif use_cache and HTTP_CACHE.is_fresh(HTTP_CACHE.get_meta(url)):
+        # Fresh cached pages need no network slot
+        result = extract_job_text(url, use_cache=True, offline=offline, session=session)
+    else:
+        result = limiter.run(url, extract_job_text, url, use_cache=use_cache, offline=offline, session=session)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def ingest_urls(urls, max_workers=DEFAULT_MAX_WORKERS, per_host=DEFAULT_PER_HOST,
+                per_host_rate=DEFAULT_PER_HOST_RATE, use_cache=True, offline=None, session=None):
+    """
+    Fetch and extract many job URLs concurrently.
+    Duplicate URLs (after normalization) are fetched once. Results are
+    yielded as each page finishes, as (index, result) pairs where result is
+    a dict with url, status ('ok', 'cached' or 'failed'), text, error,
+    source and seconds. A failing URL never stops the rest.
+    """
+    urls = [str(u).strip() for u in urls]
+    groups = {}
+    for index, url in enumerate(urls):
+        key = normalize_url(url) if url.startswith(('http://', 'https://')) else url
+        groups.setdefault(key, {'url': url, 'indexes': []})['indexes'].append(index)
+    if not groups:
+        return
+
+    session = session or get_session()
+    limiter = HostLimiter(per_host, per_host_rate)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ingest')
+    try:
+        futures = {
+            executor.submit(_ingest_one, group['url'], limiter, session, use_cache, offline): key
+            for key, group in groups.items()
+        }
+        for future in as_completed(futures):
+            group = groups[futures[future]]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'success': False, 'text': "", 'error': f"Error: {e}", 'source': None, 'seconds': 0.0}
+            if not result['success']:
+                status = 'failed'
+            elif result['source'] in ('cache', 'revalidated', 'stale'):
+                status = 'cached'
+            else:
+                status = 'ok'
+            for index in group['indexes']:
+                yield index, {**result, 'url': urls[index], 'status': status}
+    finally:
+        # Stop queued work if the caller abandons the generator early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def summarize(results):
+    """
+    Status report for ingest_urls results (an iterable of result dicts)
+    Returns: dict with total, counts per status, total_seconds and failures
+    (list of (url, error))
+    """
+    report = {'total': 0, 'ok': 0, 'cached': 0, 'failed': 0, 'total_seconds': 0.0, 'failures': []}
+    for result in results:
+        report['total'] += 1
+        report[result['status']] = report.get(result['status'], 0) + 1
+        report['total_seconds'] += result.get('seconds', 0.0)
+        if result['status'] == 'failed':
+            report['failures'].append((result['url'], result['error']))
+    report['total_seconds'] = round(report['total_seconds'], 3)
+    return report
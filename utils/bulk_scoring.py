@@ -0,0 +1,115 @@
+"""
+Vectorized match scoring for many profiles x many analyzed JDs.
+
+Skills are encoded into a shared vocabulary of canonical names; profiles
+and JDs become boolean matrices, and the 70/30 required / nice-to-have
+score for every pair comes out of two matrix products. Scores are computed
+with the same float operations as calculate_match_score, so they match it
+exactly.
+"""
+
+import numpy as np
+
+from utils.skill_index import JDIndex, ProfileIndex, display_skills
+
+
+class SkillVocabulary:
+    """Canonical skill name -> column index"""
+
+    def __init__(self, skill_sets=()):
+        self.columns = {}
+        for skills in skill_sets:
+            self.add(skills)
+
+    def add(self, skills):
+        for skill in skills:
+            self.columns.setdefault(skill, len(self.columns))
+
+    def __len__(self):
+        return len(self.columns)
+
+    def encode(self, skill_sets):
+        """Boolean matrix (len(skill_sets) x vocabulary); unknown skills are ignored"""
+        matrix = np.zeros((len(skill_sets), len(self.columns)), dtype=bool)
+        for row, skills in enumerate(skill_sets):
+            cols = [self.columns[s] for s in skills if s in self.columns]
+            matrix[row, cols] = True
+        return matrix
+
+
+def _component_scores(matched_counts, totals, weight):
+    # Same operations as calculate_match_score: (matched / total) * weight,
+    # or the full weight when the JD lists no skills of this kind
+    totals = totals.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = (matched_counts.astype(np.float64) / totals) * weight
+    return np.where(totals > 0, scores, float(weight))
+
+
+class JDArchive:
+    """
+    A set of analyzed JDs encoded once, ready to be scored against any
+    number of profiles.
+    """
+
+    def __init__(self, jd_analyses):
+        self.jd_analyses = list(jd_analyses)
+        self.jd_indexes = [JDIndex(jd) for jd in self.jd_analyses]
+        self.vocabulary = SkillVocabulary(jd.all_skills for jd in self.jd_indexes)
+
+        self.required = self.vocabulary.encode([jd.required for jd in self.jd_indexes])
+        self.nice = self.vocabulary.encode([jd.nice for jd in self.jd_indexes])
+        self.required_counts = self.required.sum(axis=1)
+        self.nice_counts = self.nice.sum(axis=1)
+        # float32 operands keep the matmul on BLAS; counts are small exact integers
+        self._required_t = self.required.T.astype(np.float32)
+        self._nice_t = self.nice.T.astype(np.float32)
+
+    def __len__(self):
+        return len(self.jd_analyses)
+
+    def score_matrix(self, profiles):
+        """
+        Raw (unrounded) scores for every profile x JD pair
+        Returns: float64 array of shape (len(profiles), len(archive))
+        """
+        profile_indexes = [p if isinstance(p, ProfileIndex) else ProfileIndex(p) for p in profiles]
+        encoded = self.vocabulary.encode([p.skills for p in profile_indexes]).astype(np.float32)
+
+        matched_required = np.rint(encoded @ self._required_t).astype(np.int64)
+        matched_nice = np.rint(encoded @ self._nice_t).astype(np.int64)
+
+        required_score = _component_scores(matched_required, self.required_counts, 70)
+        nice_score = _component_scores(matched_nice, self.nice_counts, 30)
+        return required_score + nice_score
+
+    def rank(self, profile, top_k=10):
+        """
+        Top-K JDs for one profile, best first (ties keep archive order)
+        Returns: list of dicts with index, jd_analysis and the same fields as
+        calculate_match_score
+        """
+        profile_index = profile if isinstance(profile, ProfileIndex) else ProfileIndex(profile)
+        scores = self.score_matrix([profile_index])[0]
+
+        order = np.argsort(-scores, kind='stable')[:max(top_k, 0)]
+
+        ranked = []
+        for jd_position in order.tolist():
+            total_score = float(scores[jd_position])
+            jd_index = self.jd_indexes[jd_position]
+            matched = (profile_index.skills & jd_index.required) | (profile_index.skills & jd_index.nice)
+            ranked.append({
+                'index': jd_position,
+                'jd_analysis': self.jd_analyses[jd_position],
+                'score': round(total_score, 1),
+                'matched_skills': display_skills(matched, jd_index),
+                'missing_skills': display_skills(jd_index.required - profile_index.skills, jd_index),
+                'match_percentage': f"{round(total_score)}%"
+            })
+        return ranked
+
+
+def rank_jds_for_profile(profile, jd_analyses, top_k=10):
+    """One-shot helper: encode the JDs and return the profile's top-K matches"""
+    return JDArchive(jd_analyses).rank(profile, top_k=top_k)
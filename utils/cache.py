@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Normalize text for hashing: unicode form, case and whitespace"""
+    text = unicodedata.normalize('NFKC', text or '')
+    return ' '.join(text.casefold().split())
+
+
+def make_cache_key(*parts):
+    """Stable sha256 key built from the given string parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class PersistentLRUCache:
+    """
+    Small JSON-file backed cache with TTL expiry and LRU eviction.
+    Entries live in memory and are flushed to disk on every write, so
+    they survive Streamlit restarts. Safe to share between threads.
+    """
+
+    def __init__(self, path, max_entries=256, ttl_seconds=7 * 24 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        # Stored oldest-used first, so insertion order restores LRU order
+        for key, entry in stored.get('entries', []):
+            self._entries[key] = entry
+
+    def _is_expired(self, entry, now):
+        return self.ttl_seconds is not None and now - entry['stored_at'] > self.ttl_seconds
+
+    def _merge_from_disk(self, now):
+        # Other processes (e.g. CLI workers) may have written entries since we
+        # loaded; keep theirs as least-recently-used so our own LRU order wins
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        merged = OrderedDict()
+        for key, entry in stored.get('entries', []):
+            if key not in self._entries and not self._is_expired(entry, now):
+                merged[key] = entry
+        merged.update(self._entries)
+        self._entries = merged
+
+    def _flush(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': list(self._entries.items())}, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key):
+        """Return the cached value or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry, time.time()):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['value']
+
+    def get_stale(self, key):
+        """Return the cached value even if expired (for outage fallbacks), or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry['value'] if entry is not None else None
+
+    def set(self, key, value):
+        """Store a JSON-serializable value and persist the cache"""
+        with self._lock:
+            now = time.time()
+            self._entries[key] = {'value': value, 'stored_at': now}
+            self._entries.move_to_end(key)
+            self._merge_from_disk(now)
+
+            for stale_key in [k for k, e in self._entries.items() if self._is_expired(e, now)]:
+                del self._entries[stale_key]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+            try:
+                self._flush()
+            except OSError as e:
+                print(f"Could not persist cache to {self.path}: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            try:
+                self._flush()
+            except OSError:
+                pass
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+
+def _json_default(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def stable_hash(*values):
+    """sha256 of JSON-like values, independent of dict ordering"""
+    payload = json.dumps(values, sort_keys=True, default=_json_default, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class MemoryLRUCache:
+    """
+    In-memory LRU cache bounded by entry count and total size in bytes.
+    Intended for bytes/str values such as rendered documents.
+    """
+
+    def __init__(self, max_entries=32, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sizeof(value):
+        return len(value) if isinstance(value, (bytes, bytearray, str)) else 0
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def set(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._sizeof(self._entries.pop(key))
+            if size > self.max_bytes:
+                return  # Larger than the whole cache; not worth keeping
+            self._entries[key] = value
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= self._sizeof(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
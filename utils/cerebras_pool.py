@@ -0,0 +1,148 @@
+"""
+Process-wide registry of Cerebras clients.
+
+Building a Cerebras client per request means a new HTTP connection pool,
+a fresh TLS handshake and (by default) an SDK warm-up request every time.
+Clients created here are shared across threads and Streamlit sessions and
+reuse keep-alive connections from a bounded pool. They are built with
+max_retries=0: utils/resilience.py is the only retry policy, so every
+failed request reaches its retry budget and circuit breaker.
+"""
+
+import os
+import threading
+
+try:
+    import httpx
+    from cerebras.cloud.sdk import Cerebras
+    POOLING_AVAILABLE = True
+except ImportError:
+    POOLING_AVAILABLE = False
+
+# Max concurrent connections per client (env: CEREBRAS_POOL_SIZE)
+DEFAULT_POOL_SIZE = int(os.getenv('CEREBRAS_POOL_SIZE', '10'))
+# Seconds an idle keep-alive connection is kept open (env: CEREBRAS_KEEPALIVE_EXPIRY)
+DEFAULT_KEEPALIVE_EXPIRY = float(os.getenv('CEREBRAS_KEEPALIVE_EXPIRY', '60'))
+DEFAULT_TIMEOUT = float(os.getenv('CEREBRAS_TIMEOUT', '60'))
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class _PoolStats:
+    """Thread-safe request counters shared by all pooled clients"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clients_created = 0
+        self.client_reuses = 0
+        self.requests_total = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def request_started(self):
+        with self._lock:
+            self.requests_total += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def request_finished(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+_stats = _PoolStats()
+
+
+if POOLING_AVAILABLE:
+    class _MeteredTransport(httpx.HTTPTransport):
+        """HTTP transport that tracks in-flight requests for pool metrics"""
+
+        def handle_request(self, request):
+            _stats.request_started()
+            try:
+                return super().handle_request(request)
+            finally:
+                _stats.request_finished()
+
+
+def get_pooled_client(api_key, pool_size=None, keepalive_expiry=None):
+    """
+    Return the shared Cerebras client for this API key and pool config,
+    creating it on first use.
+    """
+    if not POOLING_AVAILABLE:
+        raise ImportError("Cerebras SDK not installed")
+
+    pool_size = pool_size or DEFAULT_POOL_SIZE
+    keepalive_expiry = keepalive_expiry if keepalive_expiry is not None else DEFAULT_KEEPALIVE_EXPIRY
+    key = (api_key, pool_size, keepalive_expiry)
+
+    with _registry_lock:
+        entry = _registry.get(key)
+        if entry is not None:
+            _stats.client_reuses += 1
+            return entry['client']
+
+        transport = _MeteredTransport(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+        http_client = httpx.Client(
+            transport=transport,
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=10.0)
+        )
+        client = Cerebras(api_key=api_key, http_client=http_client, max_retries=0)
+        _registry[key] = {'client': client, 'http_client': http_client, 'transport': transport}
+        _stats.clients_created += 1
+        return client
+
+
+def _connection_counts(transport):
+    # httpcore does not expose pool stats publicly; read them best-effort
+    pool = getattr(transport, '_pool', None)
+    connections = list(getattr(pool, 'connections', None) or [])
+    idle = sum(1 for conn in connections if getattr(conn, 'is_idle', lambda: False)())
+    return len(connections), idle
+
+
+def pool_metrics():
+    """
+    Snapshot of client reuse and connection usage across all pooled clients
+    Returns: dict of counters
+    """
+    with _registry_lock:
+        entries = list(_registry.values())
+        open_connections = 0
+        idle_connections = 0
+        for entry in entries:
+            total, idle = _connection_counts(entry['transport'])
+            open_connections += total
+            idle_connections += idle
+
+        return {
+            'clients': len(entries),
+            'clients_created': _stats.clients_created,
+            'client_reuses': _stats.client_reuses,
+            'requests_total': _stats.requests_total,
+            'requests_in_flight': _stats.in_flight,
+            'peak_requests_in_flight': _stats.peak_in_flight,
+            'open_connections': open_connections,
+            'idle_connections': idle_connections,
+            'active_connections': open_connections - idle_connections,
+            'pool_size': DEFAULT_POOL_SIZE
+        }
+
+
+def close_all_clients():
+    """Close every pooled client and its connections (e.g. at process exit)"""
+    with _registry_lock:
+        for entry in _registry.values():
+            try:
+                entry['http_client'].close()
+            except Exception:
+                pass
+        _registry.clear()
@@ -3,6 +3,8 @@ from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from io import BytesIO
 
+from utils.skill_index import order_skills_by_match
+
 def set_resume_style(doc):
     """Set global font and paragraph style"""
     style = doc.styles['Normal']
@@ -60,8 +62,7 @@ def create_resume_docx(profile, jd_analysis, tailored_summary, match_details, se
     # Skills
     add_section_header(doc, "Technical Skills")
     all_skills = profile.get('skills', {}).get('technical', [])
-    matched_skills = [s for s in all_skills if s.lower() in [m.lower() for m in match_details.get('matched_skills', [])]]
-    ordered_skills = matched_skills + [s for s in all_skills if s not in matched_skills]
+    ordered_skills, _ = order_skills_by_match(all_skills, match_details)
     skills_para = doc.add_paragraph(', '.join(ordered_skills[:18]))
     skills_para.runs[0].font.size = Pt(10.5)
 
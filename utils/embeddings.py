@@ -0,0 +1,207 @@
+"""
+Optional local (CPU-only) sentence embeddings for semantic skill matching.
+
+Exact skill overlap misses related skills ("PyTorch" vs "deep learning");
+asking the LLM for every comparison is too slow. When sentence-transformers
+is installed, profile skills/bullets and JD requirements are embedded
+locally in batches and compared by cosine similarity. Vectors are kept in
+a SQLite file under data/cache keyed by (model, sha256 of the text), so
+each distinct text is encoded once across runs.
+
+Without sentence-transformers (or with RESUMEFORGE_SEMANTIC_MATCH=0)
+semantic_match_score returns None and nothing else changes.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+EMBEDDING_MODEL = os.getenv('RESUMEFORGE_EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+EMBEDDING_BATCH_SIZE = int(os.getenv('RESUMEFORGE_EMBEDDING_BATCH_SIZE', '64'))
+SEMANTIC_MATCH_ENABLED = os.getenv('RESUMEFORGE_SEMANTIC_MATCH', '1') != '0'
+# Cosine similarity at which a requirement counts as covered
+SEMANTIC_THRESHOLD = float(os.getenv('RESUMEFORGE_SEMANTIC_THRESHOLD', '0.6'))
+
+VECTOR_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache', 'embeddings.sqlite3'
+)
+
+
+def text_key(text):
+    return hashlib.sha256(str(text).encode('utf-8')).hexdigest()
+
+
+class VectorCache:
+    """Persistent text-hash -> float32 vector store (one SQLite file, many models)"""
+
+    def __init__(self, path=VECTOR_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS vectors ("
+                "model TEXT NOT NULL, key TEXT NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, key))"
+            )
+        return self._conn
+
+    def get_many(self, model, keys):
+        """Cached vectors for the given keys (missing keys are absent from the result)"""
+        found = {}
+        keys = list(keys)
+        with self._lock:
+            conn = self._connect()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM vectors WHERE model = ? AND key IN ({placeholders})",
+                    [model] + chunk
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, model, vectors):
+        """Store {key: vector}"""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO vectors (model, key, vector) VALUES (?, ?, ?)",
+                [(model, key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in vectors.items()]
+            )
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM vectors")
+            self._conn.commit()
+
+
+VECTOR_CACHE = VectorCache()
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_embedding_model():
+    """Load the sentence-transformers model once per process, pinned to CPU"""
+    global _model
+    if not EMBEDDINGS_AVAILABLE:
+        raise ImportError("sentence-transformers not installed")
+    with _model_lock:
+        if _model is None:
+            _model = SentenceTransformer(EMBEDDING_MODEL, device='cpu')
+        return _model
+
+
+def encode_texts(texts, batch_size=EMBEDDING_BATCH_SIZE, cache=VECTOR_CACHE):
+    """
+    Unit-length embeddings for texts, reusing cached vectors
+    Returns: float32 array of shape (len(texts), dim)
+    """
+    texts = [str(t) for t in texts]
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    keys = [text_key(t) for t in texts]
+    vectors = cache.get_many(EMBEDDING_MODEL, set(keys)) if cache else {}
+
+    # Encode each distinct uncached text once, in batches
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in vectors:
+            missing.setdefault(key, text)
+    if missing:
+        encoded = get_embedding_model().encode(
+            list(missing.values()),
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).astype(np.float32)
+        new_vectors = dict(zip(missing.keys(), encoded))
+        vectors.update(new_vectors)
+        if cache:
+            cache.put_many(EMBEDDING_MODEL, new_vectors)
+
+    return np.vstack([vectors[key] for key in keys])
+
+
+def _profile_texts(user_profile):
+    skills = user_profile.get('skills', {})
+    texts = list(skills.get('technical', [])) + list(skills.get('soft', []))
+    for exp in user_profile.get('experience', []):
+        texts.extend(exp.get('responsibilities', []))
+    for proj in user_profile.get('projects', []):
+        texts.extend(proj.get('tech_stack', []))
+        if proj.get('description'):
+            texts.append(' '.join(proj['description'].split()))
+    # Keep order, drop blanks and duplicates
+    return list(dict.fromkeys(t.strip() for t in map(str, texts) if t.strip()))
+
+
+def semantic_match_score(user_profile, jd_analysis, threshold=SEMANTIC_THRESHOLD):
+    """
+    Embedding-based counterpart of calculate_match_score: each JD requirement
+    is scored by its closest profile skill, bullet or project, with the same
+    70 (required skills + responsibilities) / 30 (nice-to-have) weighting.
+    Returns: dict with semantic_score, semantic_match_percentage and
+    related_skills, or None when embeddings are unavailable or disabled
+    """
+    if not (EMBEDDINGS_AVAILABLE and SEMANTIC_MATCH_ENABLED):
+        return None
+
+    profile_texts = _profile_texts(user_profile)
+    required = [str(s) for s in (jd_analysis.get('required_skills', []) or [])]
+    required += [str(r) for r in (jd_analysis.get('key_responsibilities', []) or [])]
+    nice = [str(s) for s in (jd_analysis.get('nice_to_have_skills', []) or [])]
+    if not profile_texts or not (required or nice):
+        return None
+
+    # One batched encode for both sides
+    vectors = encode_texts(profile_texts + required + nice)
+    profile_vectors = vectors[:len(profile_texts)]
+    requirement_vectors = vectors[len(profile_texts):]
+
+    # Vectors are unit length, so the dot product is the cosine similarity
+    similarity = requirement_vectors @ profile_vectors.T
+    best_index = similarity.argmax(axis=1)
+    best = np.clip(similarity.max(axis=1), 0, 1)
+
+    def component(start, count, weight):
+        if not count:
+            return weight
+        return float(best[start:start + count].mean()) * weight
+
+    total_score = component(0, len(required), 70) + component(len(required), len(nice), 30)
+
+    related = []
+    for i, requirement in enumerate(required + nice):
+        if best[i] >= threshold:
+            related.append({
+                'requirement': requirement,
+                'profile_match': profile_texts[best_index[i]],
+                'similarity': round(float(best[i]), 3)
+            })
+
+    return {
+        'semantic_score': round(total_score, 1),
+        'semantic_match_percentage': f"{round(total_score)}%",
+        'related_skills': related
+    }
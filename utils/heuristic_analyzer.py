@@ -0,0 +1,302 @@
+"""
+Deterministic offline job description analyzer.
+
+Returns the same schema as the LLM analysis (required_skills,
+nice_to_have_skills, role_type, seniority_level, key_responsibilities,
+keywords) in a few milliseconds, without an API key:
+
+- the JD is split into sections by recognizing common headings
+  ("Requirements", "Nice to have", "Responsibilities", ...). Only short,
+  title-like lines count: a trailing colon, markdown/bold/uppercase
+  styling or Title Case, no sentence punctuation and no known skill, so
+  "You have 5+ years of Python" stays a requirement line. A "Required
+  skills: Python, Go" line counts for its label's section
+- skills come from the alias dictionary in data/skill_aliases.json, matched
+  on whole words with the same compiled matcher used for bullets
+- skills in a preferred/bonus section, or in the clause of a line that
+  says "plus" / "preferred" ("Python and SQL, ideally some Kafka": only
+  Kafka), are nice-to-have; everything else is required
+- seniority comes from title words and "N+ years", the role from a title
+  line
+
+analyze_job_description falls back to it when the LLM is unavailable.
+"""
+
+import re
+from collections import Counter
+
+from utils.keyword_matcher import KeywordMatcher
+from utils.relevance import tokenize
+from utils.skill_aliases import skill_variants
+
+MAX_REQUIRED = 15
+MAX_NICE = 10
+MAX_RESPONSIBILITIES = 5
+MAX_KEYWORDS = 20
+
+# Heading patterns, checked in order on short lines (and on "Label: ..." prefixes)
+SECTION_PATTERNS = [
+    ('nice', re.compile(r"nice[\s-]to[\s-]have|preferred|bonus|good[\s-]to[\s-]have|desired|pluses|extra credit", re.I)),
+    ('required', re.compile(r"requirements?|qualifications?|must[\s-]haves?|what you.{0,4}(need|bring|have)|"
+                            r"looking for|required|skills|who you are|about you|you have", re.I)),
+    ('responsibilities', re.compile(r"responsibilit|what you.{0,4}(do|will do)|duties|your role|the role|"
+                                    r"day[\s-]to[\s-]day|you will", re.I)),
+    ('other', re.compile(r"benefits|perks|about (us|the company)|who we are|compensation|salary|"
+                         r"equal opportunity|how to apply|why join", re.I)),
+]
+
+# Words on a line that mark the skills in their clause as optional
+NICE_LINE_RE = re.compile(r"\b(nice to have|preferred|a plus|is a plus|bonus|desirable|ideally|familiarity)\b", re.I)
+# An optional clause starts after the last of these before the marker...
+CLAUSE_BREAK_RE = re.compile(r"[.;!?,](?=\s|$)")
+# ...and runs to the end of its sentence ("Ideally Go, Rust or C++." is all optional)
+SENTENCE_BREAK_RE = re.compile(r"[.;!?](?=\s|$)")
+
+# Variants that are also everyday words ("the rest of the team", "spark ideas").
+# Never counted in lowercase; capitalized at the start of a sentence only on a
+# short list line or next to another skill
+AMBIGUOUS_VARIANTS = frozenset('''
+go ts tf dl py ai rest express spark node spring torch rails react excel postman
+'''.split())
+# A list item this short ("- Spark") is a skill, not a sentence
+MAX_LIST_ITEM_WORDS = 3
+
+BULLET_RE = re.compile(r"^\s*(?:[-*•·▪◦●‣]|\d+[.)])\s*")
+MAX_HEADING_WORDS = 8
+# Short lines (up to this many words) need no heading styling beyond a capital letter
+MAX_PLAIN_HEADING_WORDS = 3
+# Sentence punctuation never appears in a heading ("Requirements:" is fine, "Go." is not)
+SENTENCE_PUNCT_RE = re.compile(r"[.!?;,]")
+# Lowercase words allowed in a Title Case heading ("Nice to Have", "About the Role")
+TITLE_SMALL_WORDS = frozenset("a an and the to of for in on at with you we our your is are".split())
+# "Required skills: Python, Go" -> label and content
+INLINE_LABEL_RE = re.compile(r"^\s*([^:]{2,40}):\s*(\S.*)$")
+TITLE_LABEL_RE = re.compile(r"^\s*(?:job\s*title|position|role|title)\s*[:\-–]\s*(.+)$", re.I)
+ROLE_NOUN_RE = re.compile(
+    r"\b(engineer|developer|programmer|analyst|scientist|architect|manager|designer|consultant|"
+    r"specialist|administrator|intern|lead|researcher|tester|devops|sre)\b", re.I
+)
+YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years|yrs)", re.I)
+SENIORITY_PATTERNS = [
+    ('Senior', re.compile(r"\b(senior|sr\.?|lead|principal|staff|head of|architect)\b", re.I)),
+    ('Entry Level', re.compile(r"\b(entry[\s-]level|graduate|intern(ship)?|fresher|trainee)\b", re.I)),
+    ('Junior', re.compile(r"\b(junior|jr\.?|associate)\b", re.I)),
+    ('Mid-Level', re.compile(r"\b(mid[\s-]level|intermediate)\b", re.I)),
+]
+
+# Words too common in any JD to be useful ATS keywords
+GENERIC_JD_WORDS = frozenset('''
+experience years year strong skills skill team teams ability knowledge working understanding
+excellent good great role company candidate candidates including required preferred plus
+'''.split())
+
+_lexicon = None
+
+
+def _skill_lexicon():
+    # Compiled once: every known spelling -> canonical skill
+    global _lexicon
+    if _lexicon is None:
+        variants = skill_variants()
+        _lexicon = (KeywordMatcher(variants.keys()), variants)
+    return _lexicon
+
+
+def _match_section(text):
+    for section, pattern in SECTION_PATTERNS:
+        if pattern.search(text):
+            return section
+    return None
+
+
+def _is_title_case(words):
+    return all(word[0].isupper() or not word[0].isalpha() or word.lower() in TITLE_SMALL_WORDS
+               for word in words) and words[0][0].isupper()
+
+
+def heading_section(line):
+    """
+    Section name if line looks like a heading, else None.
+    Headings are short, title-like lines: ending in ":", markdown/bold or
+    uppercase styled, Title Case, or at most a few words starting with a
+    capital; never with sentence punctuation or a known skill on them.
+    """
+    raw = line.strip()
+    # "**Requirements**" is bold, not a "*" bullet
+    if not raw or (BULLET_RE.match(raw) and not raw.startswith('**')):
+        return None
+    styled = raw.startswith('#') or (raw.startswith('**') and raw.rstrip(':').endswith('**'))
+    has_colon = raw.rstrip('*_ ').endswith(':')
+    text = raw.strip('#*_ ').rstrip(':').strip('*_ ')
+    words = text.split()
+    if not words or len(words) > MAX_HEADING_WORDS or SENTENCE_PUNCT_RE.search(text):
+        return None
+    title_like = (styled or has_colon or text.isupper() or _is_title_case(words) or
+                  (len(words) <= MAX_PLAIN_HEADING_WORDS and words[0][0].isupper()))
+    if not title_like or _find_skills(text):
+        return None
+    return _match_section(text)
+
+
+def inline_section(line):
+    """Section named by a "Label: content" prefix (e.g. "Nice to have: Docker"), else None"""
+    labelled = INLINE_LABEL_RE.match(BULLET_RE.sub('', line))
+    if not labelled or len(labelled.group(1).split()) > MAX_HEADING_WORDS // 2:
+        return None
+    return _match_section(labelled.group(1))
+
+
+def split_sections(jd_text):
+    """
+    Group JD lines under the heading they follow
+    Returns: list of (section, line); lines before any heading are 'intro'.
+    A "Label: content" line belongs to its label's section without changing
+    the section of the lines after it.
+    """
+    section = 'intro'
+    lines = []
+    for line in str(jd_text).splitlines():
+        if not line.strip():
+            continue
+        heading = heading_section(line)
+        if heading:
+            section = heading
+            continue
+        lines.append((inline_section(line) or section, line.strip()))
+    return lines
+
+
+def _sentence_start(line, start):
+    before = BULLET_RE.sub('', line[:start]).rstrip('*_ "\'(')
+    return not before or before[-1] in '.!?:'
+
+
+def _find_skills(line):
+    """(canonical skill, spelling) for each skill on line, longest non-overlapping matches only"""
+    return [(canonical, spelling) for _, canonical, spelling in _find_skill_spans(line)]
+
+
+def _find_skill_spans(line):
+    """Like _find_skills, with the start offset of each match first"""
+    matcher, variants = _skill_lexicon()
+    matches = []
+    for start, end, variant in matcher.find(line):
+        spelling = line[start:end]
+        ambiguous = variant.lower() in AMBIGUOUS_VARIANTS
+        if ambiguous and spelling.islower():
+            continue
+        matches.append((start, end, variant, ambiguous))
+
+    # "React.js" is one skill, not React + js: longest spans win
+    chosen = []
+    for match in sorted(matches, key=lambda m: (m[0] - m[1], m[0])):
+        if all(match[1] <= other[0] or match[0] >= other[1] for other in chosen):
+            chosen.append(match)
+    chosen.sort()
+
+    has_clear_skill = any(not ambiguous for *_, ambiguous in chosen)
+    short_item = len(BULLET_RE.sub('', line).split()) <= MAX_LIST_ITEM_WORDS
+    found = []
+    for start, end, variant, ambiguous in chosen:
+        spelling = line[start:end]
+        # "Spark collaboration..." at a sentence start: only with other skills around
+        if (ambiguous and not spelling.isupper() and _sentence_start(line, start)
+                and not (short_item or has_clear_skill)):
+            continue
+        found.append((start, variants[variant.lower()], spelling))
+    return found
+
+
+def _optional_clauses(line):
+    """(start, end) of each clause on line marked optional by NICE_LINE_RE"""
+    clauses = []
+    for marker in NICE_LINE_RE.finditer(line):
+        start = max((m.end() for m in CLAUSE_BREAK_RE.finditer(line, 0, marker.start())), default=0)
+        end = SENTENCE_BREAK_RE.search(line, marker.end())
+        clauses.append((start, end.start() if end else len(line)))
+    return clauses
+
+
+def _detect_role(lines):
+    for _, line in lines[:15]:
+        labelled = TITLE_LABEL_RE.match(line)
+        if labelled:
+            return labelled.group(1).strip()
+    for _, line in lines[:5]:
+        text = BULLET_RE.sub('', line).strip(' :')
+        if len(text.split()) <= 8 and ROLE_NOUN_RE.search(text):
+            return text
+    return 'Not specified'
+
+
+def _detect_seniority(role_type, jd_text):
+    # The title is the strongest signal, then the body text
+    for text in (role_type, jd_text):
+        for level, pattern in SENIORITY_PATTERNS:
+            if pattern.search(text):
+                return level
+    years = [int(y) for y in YEARS_RE.findall(jd_text)]
+    if years:
+        most = max(years)
+        if most >= 5:
+            return 'Senior'
+        if most >= 2:
+            return 'Mid-Level'
+        return 'Junior'
+    return 'Mid-Level'
+
+
+def analyze_job_description_offline(jd_text):
+    """Local, deterministic job description analysis in the LLM analysis schema"""
+    lines = split_sections(jd_text)
+    has_required_section = any(section == 'required' for section, _ in lines)
+
+    required = {}
+    nice = {}
+    responsibilities = []
+    for section, line in lines:
+        if section == 'other':
+            continue
+        if section == 'responsibilities' and BULLET_RE.match(line) and len(responsibilities) < MAX_RESPONSIBILITIES:
+            responsibilities.append(BULLET_RE.sub('', line).strip())
+
+        # With an explicit requirements section, skills outside it and the
+        # nice-to-have section only count as nice-to-have
+        if section == 'nice':
+            target = nice
+        elif section == 'required' or not has_required_section:
+            target = required
+        else:
+            target = nice
+        optional = _optional_clauses(line)
+        for start, canonical, spelling in _find_skill_spans(line):
+            in_optional = any(begin <= start < end for begin, end in optional)
+            (nice if in_optional else target).setdefault(canonical, spelling)
+
+    for canonical in required:
+        nice.pop(canonical, None)
+
+    role_type = _detect_role(lines)
+    required_skills = list(required.values())[:MAX_REQUIRED]
+    nice_skills = list(nice.values())[:MAX_NICE]
+
+    # Keywords: the skills, then frequent content words from the JD body
+    keywords = list(dict.fromkeys(required_skills + nice_skills))
+    seen = {k.lower() for k in keywords}
+    body = ' '.join(line for section, line in lines if section != 'other')
+    terms = Counter(t for t in tokenize(body) if len(t) > 3 and not t.isdigit() and t not in GENERIC_JD_WORDS)
+    for term, count in terms.most_common():
+        if len(keywords) >= MAX_KEYWORDS or count < 2:
+            break
+        if term not in seen:
+            keywords.append(term)
+            seen.add(term)
+
+    return {
+        'required_skills': required_skills,
+        'nice_to_have_skills': nice_skills,
+        'role_type': role_type,
+        'seniority_level': _detect_seniority(role_type, str(jd_text)),
+        'key_responsibilities': responsibilities,
+        'keywords': keywords[:MAX_KEYWORDS]
+    }
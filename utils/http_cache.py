@@ -0,0 +1,305 @@
+"""
+On-disk HTTP cache for job posting pages.
+
+Entries are keyed by the normalized URL (lowercased host, no fragment, no
+tracking parameters, sorted query) and stored under data/cache/http as
+three files: <key>.json (URL, validators, timestamps), <key>.html (raw
+body) and <key>.txt (extracted job text). Raw HTML and extracted text are
+kept separately so the text can be re-extracted without re-downloading,
+and re-downloading an unchanged page does not force a re-extraction.
+
+Within the TTL a cached page is served without touching the network.
+After it, the page is revalidated with If-None-Match / If-Modified-Since;
+a 304 only refreshes the timestamp. In offline mode only cached pages are
+served, however old.
+
+Downloads are streamed: the body is read in chunks up to HTTP_MAX_BYTES
+(anything beyond is dropped) within HTTP_MAX_SECONDS overall, and a
+response that is not HTML (by Content-Type, or by sniffing the first bytes
+when the header is missing or generic) is abandoned before its body is read.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache', 'http')
+HTTP_CACHE_TTL = float(os.getenv('RESUMEFORGE_HTTP_CACHE_TTL', str(6 * 3600)))
+# Serve cached pages only, never touch the network
+HTTP_OFFLINE = os.getenv('RESUMEFORGE_OFFLINE', '0') == '1'
+# (connect, read) seconds
+HTTP_TIMEOUT = (float(os.getenv('RESUMEFORGE_HTTP_CONNECT_TIMEOUT', '5')),
+                float(os.getenv('RESUMEFORGE_HTTP_READ_TIMEOUT', '20')))
+
+# Keep-alive connections kept per host by the shared session
+HTTP_POOL_SIZE = int(os.getenv('RESUMEFORGE_HTTP_POOL_SIZE', '16'))
+# Bytes of a page kept for extraction, and wall-clock limit for one download
+HTTP_MAX_BYTES = int(os.getenv('RESUMEFORGE_HTTP_MAX_BYTES', str(3 * 1024 * 1024)))
+HTTP_MAX_SECONDS = float(os.getenv('RESUMEFORGE_HTTP_MAX_SECONDS', '30'))
+HTTP_CHUNK_SIZE = 16 * 1024
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+# Headers that say nothing about the body; the first bytes decide
+GENERIC_CONTENT_TYPES = ('', 'application/octet-stream', 'binary/octet-stream', 'text/plain')
+HTML_SNIFF_RE = re.compile(rb'^\s*(<!--.*?-->\s*)*<(!doctype\s+html|html|head|body|meta|title|script|div)\b',
+                           re.I | re.S)
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w-]+)', re.I)
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'refid', 'trk', 'trackingid', 'src'}
+
+
+def normalize_url(url):
+    """Canonical form of a URL for cache keys"""
+    parts = urlsplit(str(url).strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path or '/'
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def _body_hash(body):
+    return hashlib.sha256(body.encode('utf-8', 'replace')).hexdigest()
+
+
+class FetchAborted(Exception):
+    """The response is not an HTML page or took too long to download"""
+
+
+def _media_type(response):
+    return (response.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+
+
+def looks_like_html(head):
+    """True if the first bytes of a body look like an HTML document"""
+    return bool(HTML_SNIFF_RE.match(head.lstrip(b'\xef\xbb\xbf')))
+
+
+def read_bounded(response, max_bytes=HTTP_MAX_BYTES, max_seconds=HTTP_MAX_SECONDS):
+    """
+    Stream an HTML body, keeping at most max_bytes
+    The deadline is checked between chunks; each socket read is still bounded
+    by the session's read timeout.
+    Returns: (body bytes, truncated)
+    Raises: FetchAborted for non-HTML responses and downloads over max_seconds
+    """
+    media_type = _media_type(response)
+    if media_type not in HTML_CONTENT_TYPES and media_type not in GENERIC_CONTENT_TYPES:
+        raise FetchAborted(f"Not an HTML page ({media_type}).")
+
+    deadline = time.monotonic() + max_seconds
+    chunks = []
+    size = 0
+    truncated = False
+    for chunk in response.iter_content(HTTP_CHUNK_SIZE):
+        if not chunks and media_type not in HTML_CONTENT_TYPES and not looks_like_html(chunk[:1024]):
+            raise FetchAborted(f"Not an HTML page ({media_type or 'no Content-Type'}).")
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            truncated = True
+            break
+        if time.monotonic() > deadline:
+            raise FetchAborted(f"Download took longer than {max_seconds:g}s.")
+    return b''.join(chunks)[:max_bytes], truncated
+
+
+def decode_body(body, response):
+    """Text of an HTML body: header charset, then <meta charset>, then UTF-8"""
+    content_type = response.headers.get('Content-Type') or ''
+    encoding = None
+    if 'charset=' in content_type.lower():
+        encoding = content_type.lower().split('charset=')[-1].split(';')[0].strip(' "\'')
+    else:
+        match = META_CHARSET_RE.search(body[:4096])
+        if match:
+            encoding = match.group(1).decode('ascii', 'ignore')
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+class HTTPCache:
+    """Raw HTML + extracted text per normalized URL, with HTTP validators"""
+
+    def __init__(self, directory=HTTP_CACHE_DIR, ttl_seconds=HTTP_CACHE_TTL):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def _path(self, url, ext):
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.{ext}")
+
+    def _read(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, path, content):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def get_meta(self, url):
+        raw = self._read(self._path(url, 'json'))
+        try:
+            return json.loads(raw) if raw else None
+        except ValueError:
+            return None
+
+    def get_html(self, url):
+        return self._read(self._path(url, 'html'))
+
+    def is_fresh(self, meta, now=None):
+        if not meta or self.ttl_seconds is None:
+            return bool(meta)
+        return (now or time.time()) - meta.get('fetched_at', 0) <= self.ttl_seconds
+
+    def store_page(self, url, html, headers=None, truncated=False):
+        """Save a freshly downloaded page and its validators"""
+        headers = headers or {}
+        meta = {
+            'url': normalize_url(url),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'content_type': headers.get('Content-Type'),
+            'fetched_at': time.time(),
+            'body_sha256': _body_hash(html),
+            'truncated': truncated
+        }
+        with self._lock:
+            self._write(self._path(url, 'html'), html)
+            self._write(self._path(url, 'json'), json.dumps(meta))
+        return meta
+
+    def touch(self, url):
+        """Mark a cached page as revalidated now (after a 304)"""
+        with self._lock:
+            meta = self.get_meta(url)
+            if meta:
+                meta['fetched_at'] = time.time()
+                self._write(self._path(url, 'json'), json.dumps(meta))
+            return meta
+
+    def get_text(self, url, version):
+        """Extracted text, if it was extracted from the currently cached HTML with this extractor version"""
+        meta = self.get_meta(url)
+        raw = self._read(self._path(url, 'txt'))
+        if not meta or not raw:
+            return None
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            return None
+        if entry.get('body_sha256') != meta.get('body_sha256') or entry.get('version') != version:
+            return None
+        return entry.get('text')
+
+    def store_text(self, url, text, version):
+        meta = self.get_meta(url)
+        if not meta:
+            return
+        entry = {'text': text, 'version': version, 'body_sha256': meta.get('body_sha256')}
+        with self._lock:
+            self._write(self._path(url, 'txt'), json.dumps(entry))
+
+    def clear(self):
+        with self._lock:
+            if not os.path.isdir(self.directory):
+                return
+            for name in os.listdir(self.directory):
+                if name.endswith(('.json', '.html', '.txt')):
+                    os.remove(os.path.join(self.directory, name))
+
+
+HTTP_CACHE = HTTPCache()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Process-wide requests session, so keep-alive connections are reused"""
+    global _session
+    if not REQUESTS_AVAILABLE:
+        raise ImportError("requests not installed")
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+            _session.headers.update({'User-Agent': USER_AGENT, 'Accept': 'text/html,application/xhtml+xml'})
+        return _session
+
+
+def fetch_html(url, cache=HTTP_CACHE, offline=None, session=None, timeout=HTTP_TIMEOUT,
+               max_bytes=HTTP_MAX_BYTES):
+    """
+    HTML for url, from the cache when possible
+    Returns: dict with html, source ('cache', 'revalidated', 'network', 'stale'
+    or None), error and aborted (True if the download was abandoned because
+    the page is not HTML or too slow)
+    """
+    offline = HTTP_OFFLINE if offline is None else offline
+    meta = cache.get_meta(url) if cache else None
+    cached_html = cache.get_html(url) if meta else None
+    if cached_html is None:
+        meta = None
+
+    if meta and (offline or cache.is_fresh(meta)):
+        return {'html': cached_html, 'source': 'cache', 'error': None, 'aborted': False}
+    if offline:
+        return {'html': None, 'source': None, 'error': "Offline mode: this URL is not in the cache.", 'aborted': False}
+
+    headers = {}
+    if meta and meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta and meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        response = (session or get_session()).get(url, headers=headers, timeout=timeout, stream=True)
+        # Closing returns the connection to the pool, or drops it if the body was not fully read
+        with response:
+            if response.status_code == 304 and meta:
+                cache.touch(url)
+                return {'html': cached_html, 'source': 'revalidated', 'error': None, 'aborted': False}
+            response.raise_for_status()
+            body, truncated = read_bounded(response, max_bytes)
+            html = decode_body(body, response)
+        if cache:
+            cache.store_page(url, html, response.headers, truncated)
+        return {'html': html, 'source': 'network', 'error': None, 'aborted': False}
+    except Exception as e:
+        if meta:
+            # Better an old copy of the posting than nothing
+            return {'html': cached_html, 'source': 'stale', 'error': None, 'aborted': False}
+        return {'html': None, 'source': None, 'error': str(e), 'aborted': isinstance(e, FetchAborted)}
@@ -0,0 +1,157 @@
+"""
+Job description compaction before LLM analysis.
+
+Scraped postings carry a lot of text the analysis never uses: benefits,
+EEO statements, company history, "apply now" footers, lines repeated by the
+page layout. compact_jd() segments the JD with the same heading detection
+as the offline analyzer, drops low-value sections and boilerplate lines
+(never inside requirements, nice-to-haves or responsibilities, never a line
+naming a skill), removes repeated lines and, if the result is still over the token budget,
+trims the least useful sections first (intro before responsibilities
+before requirements). Section headings are kept so the model can still tell
+required from nice-to-have skills, and a heading is never dropped on its
+own: a line wrongly taken for one must still reach the model.
+
+benchmarks/check_jd_compaction.py holds JDs whose requirement lines and
+skills must survive compaction; run it after changing the heading or
+boilerplate rules.
+RESUMEFORGE_JD_COMPACTION=0 sends JDs unchanged.
+"""
+
+import math
+import os
+import re
+
+from utils.heuristic_analyzer import BULLET_RE, _find_skills, heading_section
+
+# Approximate prompt tokens for the JD part of the analysis prompt
+JD_TOKEN_BUDGET = int(os.getenv('RESUMEFORGE_JD_TOKEN_BUDGET', '1200'))
+JD_COMPACTION_ENABLED = os.getenv('RESUMEFORGE_JD_COMPACTION', '1') != '0'
+
+# Boilerplate lines (matched without their bullet). Only dropped outside
+# CONTENT_SECTIONS and never when they name a skill, so the phrases are
+# kept specific: legal/EEO wording, page chrome, agency notices.
+BOILERPLATE_RE = re.compile(
+    r"\bequal (employment )?opportunity (employer|workplace)\b|"
+    r"\b(without regard to|regardless of) (race|colou?r|religion|sex|gender|age|national origin|disability)\b|"
+    r"\brace, colou?r, (religion|creed|sex)\b|\bprotected veteran status\b|"
+    r"\b(request|need) an? reasonable accommodation\b|\bparticipates? in e-verify\b|"
+    r"^(all )?(offers?( of employment)?|employment) (is |are )?(contingent|conditional) (up)?on\b|"
+    r"^(apply (now|today|here)|click (here|apply))\b|^(this (site|website) uses|we use) cookies\b|"
+    r"\b(privacy (policy|notice)|cookie (policy|settings|preferences))\b|\ball rights reserved\b|"
+    r"\b(recruitment|staffing) agenc(y|ies)\b|\bunsolicited (resumes|cvs)\b",
+    re.I
+)
+
+# Sections whose lines are only deduplicated, never filtered as boilerplate
+CONTENT_SECTIONS = ('required', 'nice', 'responsibilities')
+
+# Lower number = more important; trimmed from the highest number down
+SECTION_PRIORITY = {'required': 0, 'nice': 1, 'responsibilities': 2, 'intro': 3}
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token for English)"""
+    return math.ceil(len(text) / 4)
+
+
+def _line_key(line):
+    return ' '.join(BULLET_RE.sub('', line).casefold().split())
+
+
+def is_boilerplate(line, section):
+    """True for a legal/EEO/page-chrome line outside the sections the analysis reads"""
+    if section in CONTENT_SECTIONS:
+        return False
+    return bool(BOILERPLATE_RE.search(BULLET_RE.sub('', line).strip())) and not _find_skills(line)
+
+
+def segment_jd(jd_text):
+    """
+    Split a JD into blocks under their headings
+    Returns: list of dicts with section, heading (or None) and lines
+    """
+    blocks = [{'section': 'intro', 'heading': None, 'lines': []}]
+    for line in str(jd_text or '').splitlines():
+        if not line.strip():
+            continue
+        section = heading_section(line)
+        if section:
+            blocks.append({'section': section, 'heading': line.strip(), 'lines': []})
+        else:
+            blocks[-1]['lines'].append(line.strip())
+    return [b for b in blocks if b['lines'] or b['heading']]
+
+
+def _render(blocks):
+    parts = []
+    for block in blocks:
+        if block['heading']:
+            parts.append(block['heading'])
+        parts.extend(block['lines'])
+    return '\n'.join(parts)
+
+
+def compact_jd(jd_text, token_budget=JD_TOKEN_BUDGET):
+    """
+    Drop low-value sections, boilerplate and repeated lines, then cap to
+    token_budget
+    Returns: dict with text, original_tokens, compacted_tokens, tokens_saved,
+    dropped_lines and truncated
+    """
+    original_tokens = estimate_tokens(str(jd_text or ''))
+    if not JD_COMPACTION_ENABLED:
+        return {'text': str(jd_text or ''), 'original_tokens': original_tokens,
+                'compacted_tokens': original_tokens, 'tokens_saved': 0, 'dropped_lines': 0, 'truncated': False}
+    blocks = segment_jd(jd_text)
+
+    seen = set()
+    dropped = 0
+    kept_blocks = []
+    for block in blocks:
+        if block['section'] == 'other':
+            dropped += len(block['lines'])
+            continue
+        lines = []
+        for line in block['lines']:
+            key = _line_key(line)
+            if not key or key in seen or is_boilerplate(line, block['section']):
+                dropped += 1
+                continue
+            seen.add(key)
+            lines.append(line)
+        kept_blocks.append({**block, 'lines': lines})
+
+    # Over budget: drop lines from the end of the least important sections
+    truncated = False
+    text = _render(kept_blocks)
+    if token_budget and estimate_tokens(text) > token_budget:
+        truncated = True
+        excess = estimate_tokens(text) - token_budget
+        order = sorted(kept_blocks, key=lambda b: SECTION_PRIORITY.get(b['section'], 3), reverse=True)
+        for block in order:
+            while block['lines'] and excess > 0:
+                removed = block['lines'].pop()
+                # +1 for the newline
+                excess -= estimate_tokens(removed + '\n')
+                dropped += 1
+            if excess <= 0:
+                break
+        text = _render(kept_blocks)
+        # A single huge line (no line breaks in the source) can still be over
+        if estimate_tokens(text) > token_budget:
+            text = text[:token_budget * 4]
+
+    if not text.strip():
+        # Nothing recognizable survived; better to send the raw text than nothing
+        text = str(jd_text or '')[:token_budget * 4] if token_budget else str(jd_text or '')
+
+    compacted_tokens = estimate_tokens(text)
+    return {
+        'text': text,
+        'original_tokens': original_tokens,
+        'compacted_tokens': compacted_tokens,
+        'tokens_saved': max(0, original_tokens - compacted_tokens),
+        'dropped_lines': dropped,
+        'truncated': truncated
+    }
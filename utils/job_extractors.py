@@ -0,0 +1,209 @@
+"""
+Fast-path extractors for job posting pages.
+
+trafilatura with its fallback chain is accurate but slow on heavy pages.
+Most job boards already expose the posting in a predictable place: a
+schema.org JobPosting in JSON-LD (read with a regex and json, no HTML
+parse), or a description container with a stable id/class (lxml XPath;
+lxml is installed with trafilatura). The extractors registered here are
+tried in order before the generic path; the first one returning enough
+text wins.
+
+An extractor is a function (html, url) -> text or None. Register new ones
+with register_extractor(name, func, hosts); hosts limits it to those
+domains (and their subdomains), None means every page.
+"""
+
+import html as html_lib
+import json
+import re
+import time
+from urllib.parse import urlsplit
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Same threshold as the generic path: shorter texts are not a posting
+MIN_TEXT_CHARS = 100
+
+JSON_LD_RE = re.compile(
+    r'<script[^>]*type\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.I | re.S
+)
+_DROP_RE = re.compile(r'<(script|style|noscript|svg)\b.*?</\1\s*>', re.I | re.S)
+_BREAK_RE = re.compile(r'<br\s*/?>|</?(p|div|section|article|ul|ol|table|tr|h[1-6]|header|footer)\b[^>]*>', re.I)
+_ITEM_RE = re.compile(r'<li\b[^>]*>', re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+# lxml refuses str input that declares an encoding
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+EXTRACTORS = []
+
+
+def register_extractor(name, func, hosts=None):
+    """Add an extractor to the end of the registry"""
+    EXTRACTORS.append({'name': name, 'func': func, 'hosts': tuple(hosts) if hosts else None})
+    return func
+
+
+def _host_matches(host, hosts):
+    return hosts is None or any(host == h or host.endswith('.' + h) for h in hosts)
+
+
+def html_to_text(fragment):
+    """Plain text of an HTML fragment, one block (paragraph, list item, heading) per line"""
+    text = _DROP_RE.sub('', fragment)
+    text = _ITEM_RE.sub('\n- ', text)
+    text = _BREAK_RE.sub('\n', text)
+    text = html_lib.unescape(_TAG_RE.sub('', text))
+    lines = (' '.join(line.split()) for line in text.splitlines())
+    return '\n'.join(line for line in lines if line and line != '-')
+
+
+# ---------- JSON-LD JobPosting ----------
+
+def _iter_json_ld(obj):
+    if isinstance(obj, list):
+        for item in obj:
+            yield from _iter_json_ld(item)
+    elif isinstance(obj, dict):
+        yield obj
+        if '@graph' in obj:
+            yield from _iter_json_ld(obj['@graph'])
+
+
+def _is_job_posting(obj):
+    types = obj.get('@type')
+    types = types if isinstance(types, list) else [types]
+    return 'JobPosting' in types
+
+
+def _ld_text(value):
+    """Text of a JSON-LD field that may be a string, a list or a named object (e.g. Organization)"""
+    if isinstance(value, list):
+        return ', '.join(t for t in (_ld_text(v) for v in value) if t)
+    if isinstance(value, dict):
+        return _ld_text(value.get('name'))
+    return str(value or '').strip()
+
+
+def _location_text(location):
+    if isinstance(location, list):
+        return '; '.join(t for t in (_location_text(l) for l in location) if t)
+    if isinstance(location, dict):
+        address = location.get('address', location)
+        if isinstance(address, dict):
+            parts = [address.get('addressLocality'), address.get('addressRegion'), address.get('addressCountry')]
+            return ', '.join(_ld_text(p) for p in parts if p)
+        return _ld_text(address)
+    return _ld_text(location)
+
+
+def _posting_text(posting):
+    description = str(posting.get('description') or '')
+    if '&lt;' in description:
+        # Some boards escape the description HTML twice
+        description = html_lib.unescape(description)
+
+    lines = []
+    if posting.get('title'):
+        lines.append(_ld_text(posting['title']))
+    header = [
+        ('Company', _ld_text(posting.get('hiringOrganization'))),
+        ('Location', _location_text(posting.get('jobLocation'))),
+        ('Employment type', _ld_text(posting.get('employmentType')))
+    ]
+    lines.extend(f"{label}: {value}" for label, value in header if value)
+    lines.append(html_to_text(description))
+    for field, label in (('responsibilities', 'Responsibilities'), ('qualifications', 'Qualifications'),
+                         ('skills', 'Skills'), ('experienceRequirements', 'Experience')):
+        value = posting.get(field)
+        if isinstance(value, str) and value.strip():
+            lines.append(f"{label}:\n{html_to_text(value)}")
+    return '\n'.join(line for line in lines if line)
+
+
+def extract_json_ld(html, url=None):
+    """Text of the first schema.org JobPosting embedded as JSON-LD"""
+    for block in JSON_LD_RE.findall(html):
+        try:
+            data = json.loads(block.strip(), strict=False)
+        except ValueError:
+            continue
+        for obj in _iter_json_ld(data):
+            if _is_job_posting(obj) and obj.get('description'):
+                return _posting_text(obj)
+    return None
+
+
+# ---------- XPath rules per job board ----------
+
+def has_class(name):
+    """XPath predicate for an element with `name` among its classes"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def xpath_extractor(title_paths, body_paths):
+    """
+    Extractor taking the title from the first matching title path and the
+    text of every element matched by the first body path that matches
+    """
+    def extract(html, url=None):
+        if not LXML_AVAILABLE:
+            return None
+        tree = lxml.html.fromstring(_XML_DECL_RE.sub('', html, count=1))
+        for path in body_paths:
+            elements = tree.xpath(path)
+            if elements:
+                break
+        else:
+            return None
+        title = next((' '.join(el.text_content().split()) for path in title_paths for el in tree.xpath(path)), '')
+        body = '\n'.join(html_to_text(lxml.html.tostring(el, encoding='unicode')) for el in elements)
+        return f"{title}\n{body}" if title else body
+    return extract
+
+
+register_extractor('json-ld', extract_json_ld)
+register_extractor('greenhouse', xpath_extractor(
+    [f'//h1[{has_class("app-title")}]', f'//*[{has_class("job__title")}]//h1', '//h1'],
+    ['//div[@id="content"]', f'//*[{has_class("job__description")}]']
+), hosts=['greenhouse.io'])
+register_extractor('lever', xpath_extractor(
+    [f'//*[{has_class("posting-headline")}]/h2'],
+    [f'//*[@data-qa="job-description"] | //*[{has_class("section")} and {has_class("page-centered")}]']
+), hosts=['lever.co'])
+register_extractor('linkedin', xpath_extractor(
+    [f'//h1[{has_class("top-card-layout__title")}]', f'//h1[{has_class("topcard__title")}]', '//h1'],
+    [f'//*[{has_class("show-more-less-html__markup")}]', f'//*[{has_class("description__text")}]']
+), hosts=['linkedin.com'])
+register_extractor('indeed', xpath_extractor(
+    ['//*[@data-testid="jobsearch-JobInfoHeader-title"]', f'//h1[{has_class("jobsearch-JobInfoHeader-title")}]', '//h1'],
+    ['//*[@id="jobDescriptionText"]']
+), hosts=['indeed.com'])
+
+
+def run_extractors(html, url, extractors=None):
+    """
+    Try the registered extractors that apply to url, in order
+    Returns: dict with text (None if none succeeded), extractor (name of the
+    one that did) and timings (list of (name, seconds) for every one tried)
+    """
+    host = (urlsplit(url).hostname or '').lower()
+    result = {'text': None, 'extractor': None, 'timings': []}
+    for extractor in (EXTRACTORS if extractors is None else extractors):
+        if not _host_matches(host, extractor['hosts']):
+            continue
+        start = time.perf_counter()
+        try:
+            text = extractor['func'](html, url)
+        except Exception as e:
+            print(f"{extractor['name']} extractor failed on {url}: {e}")
+            text = None
+        result['timings'].append((extractor['name'], round(time.perf_counter() - start, 4)))
+        if text and len(text) >= MIN_TEXT_CHARS:
+            result.update(text=text, extractor=extractor['name'])
+            break
+    return result
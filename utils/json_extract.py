@@ -0,0 +1,306 @@
+"""
+Tolerant JSON extraction for LLM responses.
+
+Models wrap JSON in prose or code fences, and stop mid-object when they hit
+max_tokens. Instead of splitting on backticks and hoping:
+
+- JSONStreamExtractor scans text (whole or chunk by chunk) for the first
+  balanced object/array, ignoring brackets inside strings
+- a truncated value is repaired by closing open brackets and dropping a
+  dangling key or half-written item
+- request_json asks the model to *continue* a truncated answer (and to
+  fill in only the keys it left out) instead of re-running the request
+- validate_schema checks expected keys and coerces obvious type slips
+  ("Python, SQL" -> ["Python", "SQL"])
+"""
+
+import json
+
+MAX_CONTINUATIONS = 2
+
+CONTINUE_PROMPT = ("Your previous reply was cut off. Continue exactly where it stopped, "
+                   "without repeating anything and without code fences.")
+
+
+class JSONExtractionError(ValueError):
+    """No usable JSON value could be recovered from a response"""
+
+
+def _strip_trailing_commas(text):
+    # Remove commas directly before a closing bracket, outside strings
+    out = []
+    in_string = escape = False
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch in '}]':
+            while out and out[-1] in ' \t\r\n':
+                out.pop()
+            if out and out[-1] == ',':
+                out.pop()
+        elif ch == '"':
+            in_string = True
+        out.append(ch)
+    return ''.join(out)
+
+
+def _loads(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json.loads(_strip_trailing_commas(text))
+
+
+class JSONStreamExtractor:
+    """
+    Incrementally finds the first balanced JSON object or array in a stream
+    of text. feed() returns the parsed value as soon as it is complete, so a
+    streaming caller can stop reading there.
+    """
+
+    def __init__(self, expect=None):
+        # dict / list restricts which opening bracket starts a candidate
+        self.openers = {dict: '{', list: '['}.get(expect, '{[')
+        self.buffer = ''
+        self.value = None
+        self.complete = False
+        self._reset(0)
+
+    def _reset(self, position):
+        self._pos = position
+        self._start = None
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        # Offsets (relative to the buffer) where the fragment can be cut
+        self._cuts = []
+
+    @property
+    def started(self):
+        """True once an opening bracket has been seen"""
+        return self._start is not None
+
+    def feed(self, chunk):
+        """Add text; returns the value once the first balanced one has closed"""
+        if self.complete:
+            return self.value
+        self.buffer += chunk
+        self._scan()
+        return self.value if self.complete else None
+
+    def _scan(self):
+        buffer = self.buffer
+        while self._pos < len(buffer):
+            ch = buffer[self._pos]
+            self._pos += 1
+            if self._start is None:
+                if ch in self.openers:
+                    self._start = self._pos - 1
+                    self._stack.append(ch)
+                    self._cuts.append(self._pos)
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._stack.append(ch)
+                self._cuts.append(self._pos)
+            elif ch in '}]':
+                self._stack.pop()
+                if not self._stack:
+                    segment = buffer[self._start:self._pos]
+                    try:
+                        self.value = _loads(segment)
+                        self.complete = True
+                        return
+                    except ValueError:
+                        # Balanced but not JSON (e.g. "[see below]"): try the next opener
+                        self._reset(self._start + 1)
+                        continue
+                self._cuts.append(self._pos)
+            elif ch == ',':
+                self._cuts.append(self._pos - 1)
+
+    def repair(self):
+        """
+        Best-effort value for a truncated candidate: close the open brackets,
+        cutting back to the last complete item if needed.
+        Returns: the repaired value, or None
+        """
+        if self.complete:
+            return self.value
+        if self._start is None:
+            return None
+        fragment = self.buffer[self._start:]
+        cut_points = [len(fragment)] + [c - self._start for c in reversed(self._cuts)]
+        for cut in cut_points:
+            candidate = _close_fragment(fragment[:cut])
+            if candidate is None:
+                continue
+            try:
+                return _loads(candidate)
+            except ValueError:
+                continue
+        return None
+
+
+def _close_fragment(fragment):
+    # Rescan the (possibly cut) fragment, then append the missing closers
+    stack = []
+    in_string = escape = False
+    for ch in fragment:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append(ch)
+        elif ch in '}]':
+            if not stack:
+                return None
+            stack.pop()
+    if in_string:
+        # A half-written string ("Kuber") is dropped, not closed
+        return None
+    text = fragment.rstrip()
+    while text and text[-1] in ',:':
+        text = text[:-1].rstrip()
+    return text + ''.join('}' if c == '{' else ']' for c in reversed(stack))
+
+
+def extract_json(text, expect=None):
+    """
+    First JSON value in text, repairing truncation if needed
+    Returns: (value, complete) - complete is False when the value was repaired
+    Raises: JSONExtractionError when nothing usable is found
+    """
+    extractor = JSONStreamExtractor(expect)
+    value = extractor.feed(text or '')
+    if extractor.complete:
+        return value, True
+    repaired = extractor.repair()
+    if repaired is None:
+        raise JSONExtractionError(f"No JSON {expect.__name__ if expect else 'value'} found in response")
+    return repaired, False
+
+
+def _as_list(value):
+    if isinstance(value, list):
+        return [v if isinstance(v, (str, dict)) else str(v) for v in value if v is not None]
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(',') if part.strip()]
+    if value is None:
+        return []
+    return [str(value)]
+
+
+def _as_str(value):
+    if isinstance(value, list):
+        return ', '.join(str(v) for v in value)
+    return '' if value is None else str(value)
+
+
+def validate_schema(value, schema):
+    """
+    Check a parsed object against {key: list | str}, coercing near misses
+    Returns: (cleaned dict, list of missing keys)
+    Raises: JSONExtractionError if value is not an object
+    """
+    if not isinstance(value, dict):
+        raise JSONExtractionError(f"Expected a JSON object, got {type(value).__name__}")
+    cleaned = dict(value)
+    missing = []
+    for key, kind in schema.items():
+        if key not in value:
+            missing.append(key)
+            continue
+        cleaned[key] = _as_list(value[key]) if kind is list else _as_str(value[key])
+    return cleaned, missing
+
+
+def _reply(response):
+    choice = response.choices[0]
+    text = choice.message.content or ''
+    return text, getattr(choice, 'finish_reason', None)
+
+
+def _strip_fence(text):
+    # Continuations sometimes reopen a code fence; otherwise keep the text
+    # verbatim, since it may resume in the middle of a string
+    stripped = text.lstrip()
+    if stripped.startswith('```'):
+        text = stripped[3:]
+        if text.lower().startswith('json'):
+            text = text[4:]
+        text = text.lstrip('\r\n')
+    return text.replace('```', '')
+
+
+def request_json(client, messages, expect=dict, schema=None, max_continuations=MAX_CONTINUATIONS, **create_kwargs):
+    """
+    Chat completion that must yield JSON. A reply cut off at max_tokens (or
+    otherwise unbalanced) is continued rather than retried from scratch, and
+    keys missing from the schema are requested on their own and merged in.
+    Returns: the parsed (and, with a schema, validated) value
+    Raises: JSONExtractionError when nothing usable can be recovered
+    """
+    text, finish_reason = _reply(client.chat.completions.create(messages=messages, **create_kwargs))
+    continuations = 0
+
+    while True:
+        extractor = JSONStreamExtractor(expect)
+        extractor.feed(text)
+        if extractor.complete or continuations >= max_continuations:
+            break
+        if finish_reason != 'length' and not extractor.started:
+            # Not truncated and no JSON at all: a continuation would not help
+            break
+        continuations += 1
+        follow_up = messages + [
+            {"role": "assistant", "content": text},
+            {"role": "user", "content": CONTINUE_PROMPT}
+        ]
+        more, finish_reason = _reply(client.chat.completions.create(messages=follow_up, **create_kwargs))
+        text += _strip_fence(more)
+
+    value = extractor.value if extractor.complete else extractor.repair()
+    if value is None:
+        raise JSONExtractionError(f"No JSON {expect.__name__ if expect else 'value'} found in response")
+    if schema is None:
+        return value
+
+    value, missing = validate_schema(value, schema)
+    if missing and continuations < max_continuations:
+        follow_up = messages + [
+            {"role": "assistant", "content": json.dumps(value)},
+            {"role": "user", "content": f"Return ONLY a JSON object with the missing keys: {', '.join(missing)}"}
+        ]
+        more, _ = _reply(client.chat.completions.create(messages=follow_up, **create_kwargs))
+        try:
+            extra, _ = extract_json(more, dict)
+            value.update({k: v for k, v in extra.items() if k in missing})
+            value, missing = validate_schema(value, schema)
+        except JSONExtractionError:
+            pass
+    # Whatever is still missing gets an empty default rather than failing the analysis
+    for key in missing:
+        value[key] = [] if schema[key] is list else ''
+    return value
@@ -0,0 +1,105 @@
+"""
+Compiled keyword matching for experience bullets.
+
+score() keeps the speed of a plain `keyword in text` loop (a C-level
+substring search per keyword) and only checks word boundaries around the
+hits, so "Go" no longer matches inside "good", while "C++", ".NET" and
+"Node.js" still match. find() needs the match positions, so it tokenizes
+the text once and looks tokens up in a table keyed by each keyword's
+first token.
+"""
+
+import re
+from functools import lru_cache
+
+# Words, or single punctuation characters ("node.js" -> node . js)
+_TOKEN_RE = re.compile(r'\w+|[^\w\s]')
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+def _boundary_pattern(key):
+    """
+    Regex finding key with no word character glued to its word-character
+    ends, or None if neither end is a word character. The literal comes
+    first so the regex engine can use its fast literal search; the check
+    on the character before is a lookbehind placed after it.
+    """
+    check_start, check_end = _is_word_char(key[0]), _is_word_char(key[-1])
+    if not (check_start or check_end):
+        return None
+    literal = re.escape(key)
+    return re.compile(
+        literal + (rf'(?<!\w{literal})' if check_start else '') + (r'(?!\w)' if check_end else '')
+    )
+
+
+class KeywordMatcher:
+    """Matches a fixed keyword list against text on word boundaries"""
+
+    def __init__(self, keywords):
+        # Lowercased keyword -> first spelling seen
+        self.keywords = {}
+        # First token -> [(keyword tokens, lowercased keyword)]
+        self._table = {}
+        # (lowercased keyword, boundary regex or None) for score()
+        self._checks = []
+
+        for keyword in keywords:
+            keyword = str(keyword).strip()
+            key = ' '.join(keyword.lower().split())
+            tokens = tuple(_TOKEN_RE.findall(key))
+            if not tokens or key in self.keywords:
+                continue
+            self.keywords[key] = keyword
+            self._table.setdefault(tokens[0], []).append((tokens, key))
+            self._checks.append((key, _boundary_pattern(key)))
+
+    def _scan(self, tokens):
+        for i, token in enumerate(tokens):
+            candidates = self._table.get(token)
+            if candidates is None:
+                continue
+            for kw_tokens, key in candidates:
+                end = i + len(kw_tokens)
+                if tuple(tokens[i:end]) == kw_tokens:
+                    yield i, end, key
+
+    def find(self, text):
+        """
+        All keyword occurrences in text (overlapping ones included, e.g. both
+        "machine learning" and "learning")
+        Returns: list of (start, end, keyword) character spans, keyword in its original spelling
+        """
+        if not self._table or not text:
+            return []
+        matches = list(_TOKEN_RE.finditer(text))
+        tokens = [m.group().lower() for m in matches]
+        return [
+            (matches[i].start(), matches[end - 1].end(), self.keywords[key])
+            for i, end, key in self._scan(tokens)
+        ]
+
+    def score(self, text):
+        """Number of distinct keywords present in text"""
+        if not self._checks or not text:
+            return 0
+        text = text.lower()
+        count = 0
+        # The C-level substring test rejects most keywords; boundaries are checked on hits only
+        for key, pattern in self._checks:
+            if key in text and (pattern is None or pattern.search(text)):
+                count += 1
+        return count
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(keywords):
+    return KeywordMatcher(keywords)
+
+
+def get_keyword_matcher(keywords):
+    """Compiled matcher for a keyword list, reused across calls with the same list"""
+    return _cached_matcher(tuple(str(k) for k in keywords or []))
@@ -0,0 +1,127 @@
+"""
+Long-lived PDF rendering workers.
+
+pdfkit forks a fresh wkhtmltopdf process for every resume and waits on a
+fixed JavaScript delay. Here WeasyPrint renders in a small pool of
+pre-warmed worker processes (fonts and CSS machinery already loaded), fed
+through the executor's job queue. The app calls start_pdf_workers() when
+it loads, so the pool is spawned and warmed before the first download.
+Rendering in-process is also supported for callers that already run in
+a worker process (e.g. the batch CLI).
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from weasyprint import CSS, HTML
+    from weasyprint.urls import default_url_fetcher
+    WEASYPRINT_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: WeasyPrint installed but its native libraries (Pango) are missing
+    WEASYPRINT_AVAILABLE = False
+
+# Worker processes kept warm for rendering; 0 renders in the calling process
+PDF_WORKERS = int(os.getenv('RESUMEFORGE_PDF_WORKERS', '2'))
+PDF_RENDER_TIMEOUT = float(os.getenv('RESUMEFORGE_PDF_TIMEOUT', '60'))
+
+# Same page setup the pdfkit renderer used
+PAGE_CSS = "@page { size: A4; margin: 0.75in; }"
+
+_executor = None
+_executor_lock = threading.Lock()
+_page_stylesheet = None
+
+
+def _offline_url_fetcher(url, *args, **kwargs):
+    # Never block a render on the network (e.g. the Google Fonts @import);
+    # WeasyPrint logs the failure and falls back to the system fonts
+    if url.startswith(('http://', 'https://')):
+        raise ValueError(f"Remote resources are disabled for PDF rendering: {url}")
+    return default_url_fetcher(url, *args, **kwargs)
+
+
+def render_pdf_bytes(html_string):
+    """Render HTML to PDF bytes with WeasyPrint in the current process"""
+    global _page_stylesheet
+    if not WEASYPRINT_AVAILABLE:
+        raise ImportError("WeasyPrint not installed")
+    if _page_stylesheet is None:
+        _page_stylesheet = CSS(string=PAGE_CSS)
+    document = HTML(string=html_string, url_fetcher=_offline_url_fetcher)
+    return document.write_pdf(stylesheets=[_page_stylesheet])
+
+
+def _warm_up_worker():
+    # Pay font discovery and stylesheet parsing once per worker, not per resume
+    try:
+        render_pdf_bytes("<html><body><p>warm-up</p></body></html>")
+    except Exception:
+        pass
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                # spawn: forking a multi-threaded Streamlit server is not safe
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_warm_up_worker
+            )
+        return _executor
+
+
+def _spawn_workers():
+    try:
+        executor = _get_executor()
+        # Workers are spawned on demand: one trivial task each starts them all,
+        # and each runs the warm-up initializer before taking it
+        for _ in range(PDF_WORKERS):
+            executor.submit(os.getpid)
+    except Exception as e:
+        print(f"PDF worker warm-up failed: {e}")
+
+
+def start_pdf_workers():
+    """
+    Spawn and warm the PDF worker pool in the background, so the first
+    render does not pay for process start-up and the WeasyPrint import
+    Returns: True if warm-up was started
+    """
+    if PDF_WORKERS <= 0 or not WEASYPRINT_AVAILABLE:
+        return False
+    threading.Thread(target=_spawn_workers, name='pdf-warm-up', daemon=True).start()
+    return True
+
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def render_pdf(html_string, in_process=False, timeout=PDF_RENDER_TIMEOUT):
+    """
+    Render HTML to PDF bytes, using the warm worker pool when enabled.
+    Falls back to rendering in this process if the pool is unavailable.
+    """
+    if in_process or PDF_WORKERS <= 0:
+        return render_pdf_bytes(html_string)
+
+    try:
+        return _get_executor().submit(render_pdf_bytes, html_string).result(timeout=timeout)
+    except BrokenProcessPool:
+        # A worker crashed; start a fresh pool next time and render here now
+        _reset_executor()
+        return render_pdf_bytes(html_string)
+
+
+def shutdown_pdf_workers():
+    _reset_executor()
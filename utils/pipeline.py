@@ -0,0 +1,82 @@
+import time
+
+from utils.ai_analyzer import (
+    analyze_job_description,
+    calculate_match_score,
+    generate_tailored_summary,
+    select_best_projects,
+    optimize_experience_bullets
+)
+from utils.docx_builder import create_resume_docx
+from utils.html_resume_builder import create_html_resume, html_to_pdf
+from utils.skill_index import JDIndex, ProfileIndex
+
+SUPPORTED_FORMATS = ('pdf', 'docx', 'html')
+
+
+def tailor_resume(profile, jd_text, formats=('pdf', 'docx'), ai_summary=True, allow_offline_analysis=False):
+    """
+    Run the full pipeline for one job description without any UI:
+    analyze -> score -> select projects -> optimize bullets -> render.
+    If the LLM analysis fails the job fails too, unless allow_offline_analysis
+    lets the heuristic analyzer stand in (analysis_source says which one ran).
+    Returns: dict with success, error, jd_analysis, match_details,
+    analysis_source, analysis_warning and files (format -> bytes) for each
+    requested format that rendered
+    """
+    start = time.perf_counter()
+    result = {'success': False, 'error': None, 'jd_analysis': None, 'match_details': None,
+              'analysis_source': None, 'analysis_warning': None, 'files': {}}
+
+    analysis_result = analyze_job_description(jd_text, fallback=allow_offline_analysis)
+    result['analysis_source'] = analysis_result.get('source')
+    result['analysis_warning'] = analysis_result.get('warning')
+    if not analysis_result['success']:
+        result['error'] = f"Analysis failed: {analysis_result['error']}"
+        return result
+
+    jd_analysis = analysis_result['data']
+    indexes = {'profile_index': ProfileIndex(profile), 'jd_index': JDIndex(jd_analysis)}
+    match_details = calculate_match_score(profile, jd_analysis, **indexes)
+
+    if ai_summary:
+        tailored_summary = generate_tailored_summary(profile, jd_analysis)
+    else:
+        tailored_summary = profile.get('personal', {}).get('summary', '')
+
+    selected_projects = select_best_projects(profile, jd_analysis, max_projects=3, **indexes)
+    optimized_experiences = optimize_experience_bullets(
+        profile.get('experience', []),
+        jd_analysis.get('keywords', []),
+        max_bullets=3,
+        jd_analysis=jd_analysis
+    )
+
+    render_args = (profile, jd_analysis, tailored_summary, match_details,
+                   selected_projects, optimized_experiences)
+
+    errors = []
+    html_resume = None
+    if 'html' in formats or 'pdf' in formats:
+        html_resume = create_html_resume(*render_args)
+    if 'html' in formats:
+        result['files']['html'] = html_resume.encode('utf-8')
+    if 'pdf' in formats:
+        # Batch callers already run one job per process, so skip the worker pool
+        pdf_file = html_to_pdf(html_resume, in_process=True)
+        if pdf_file:
+            result['files']['pdf'] = pdf_file.getvalue()
+        else:
+            errors.append("PDF generation failed")
+    if 'docx' in formats:
+        result['files']['docx'] = create_resume_docx(*render_args).getvalue()
+
+    result.update({
+        'success': not errors,
+        'error': '; '.join(errors) or None,
+        'jd_analysis': jd_analysis,
+        'match_details': match_details,
+        'tailored_summary': tailored_summary,
+        'seconds': round(time.perf_counter() - start, 2)
+    })
+    return result
@@ -0,0 +1,110 @@
+"""
+Reverse matching: rank many candidate profiles against one JD.
+
+Profiles are indexed once into an inverted index (canonical skill ->
+profiles that list it). Ranking a JD only touches candidates that share at
+least one required skill, counts their matches from the postings lists and
+scores them with the same 70/30 formula as calculate_match_score.
+"""
+
+import heapq
+import json
+import os
+from collections import defaultdict
+
+from utils.skill_index import JDIndex, ProfileIndex, display_skills
+
+
+def _match_score(matched_required, total_required, matched_nice, total_nice):
+    # Mirrors calculate_match_score exactly
+    required_score = (matched_required / total_required) * 70 if total_required else 70
+    nice_score = (matched_nice / total_nice) * 30 if total_nice else 30
+    return required_score + nice_score
+
+
+class ProfileCorpus:
+    """Many profiles in the data/user_profile.json format, indexed by skill"""
+
+    def __init__(self, profiles):
+        """profiles: iterable of (profile_id, profile dict)"""
+        self.profile_ids = []
+        self.profiles = []
+        self.indexes = []
+        self.postings = defaultdict(list)
+
+        for profile_id, profile in profiles:
+            self.add(profile_id, profile)
+
+    def add(self, profile_id, profile):
+        position = len(self.profiles)
+        profile_index = ProfileIndex(profile)
+        self.profile_ids.append(profile_id)
+        self.profiles.append(profile)
+        self.indexes.append(profile_index)
+        for skill in profile_index.skills:
+            self.postings[skill].append(position)
+
+    def __len__(self):
+        return len(self.profiles)
+
+    @classmethod
+    def from_directory(cls, path):
+        """Load every *.json profile in a directory (id = file name without extension)"""
+        corpus = cls([])
+        for name in sorted(os.listdir(path)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() != '.json':
+                continue
+            try:
+                with open(os.path.join(path, name), 'r', encoding='utf-8') as f:
+                    corpus.add(stem, json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Skipping profile {name}: {e}")
+        return corpus
+
+    def rank(self, jd_analysis, top_n=10):
+        """
+        Best-matching profiles for one JD analysis, best first
+        Returns: list of dicts with profile_id, profile, score, match_percentage,
+        matched_skills and missing_skills
+        """
+        jd_index = JDIndex(jd_analysis)
+        total_required = len(jd_index.required)
+        total_nice = len(jd_index.nice)
+
+        required_counts = defaultdict(int)
+        for skill in jd_index.required:
+            for position in self.postings.get(skill, ()):
+                required_counts[position] += 1
+
+        if total_required:
+            candidates = required_counts.keys()
+        else:
+            # Nothing required: everyone starts at the full 70
+            candidates = range(len(self.profiles))
+
+        nice_counts = defaultdict(int)
+        for skill in jd_index.nice:
+            for position in self.postings.get(skill, ()):
+                nice_counts[position] += 1
+
+        scored = (
+            (_match_score(required_counts.get(p, 0), total_required, nice_counts.get(p, 0), total_nice), -p)
+            for p in candidates
+        )
+        top = heapq.nlargest(top_n, scored)
+
+        results = []
+        for total_score, negative_position in top:
+            position = -negative_position
+            profile_skills = self.indexes[position].skills
+            matched = (profile_skills & jd_index.required) | (profile_skills & jd_index.nice)
+            results.append({
+                'profile_id': self.profile_ids[position],
+                'profile': self.profiles[position],
+                'score': round(total_score, 1),
+                'match_percentage': f"{round(total_score)}%",
+                'matched_skills': display_skills(matched, jd_index),
+                'missing_skills': display_skills(jd_index.required - profile_skills, jd_index)
+            })
+        return results
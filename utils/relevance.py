@@ -0,0 +1,199 @@
+"""
+Offline text relevance for projects and experience bullets.
+
+A small BM25 index over the profile's project descriptions and
+responsibility bullets, queried with the JD's skills, keywords and
+responsibilities. The index is updated incrementally: when the profile
+changes only the documents whose text changed are re-tokenized, and the
+collection statistics (document frequencies, average length) are adjusted
+in place rather than rebuilt.
+
+select_best_projects and optimize_experience_bullets blend these scores
+with their existing tech-stack / keyword counts; no LLM calls are made.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+
+from utils.cache import stable_hash
+from utils.skill_index import normalize_skill
+
+# Keeps "c++", "c#", "node.js" and "ci/cd" style terms whole
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the their this
+to was were will with using used use via across within over our we you your i my me
+developed built worked work working responsible including etc
+""".split())
+
+
+def tokenize(text):
+    """Lowercased content terms of a text, stop words dropped"""
+    terms = []
+    for word in _WORD_RE.findall(str(text).lower()):
+        word = word.rstrip('./-')
+        if word and word not in STOPWORDS:
+            terms.append(word)
+    return terms
+
+
+class BM25Index:
+    """Okapi BM25 over a mutable set of documents"""
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        # doc_id -> (text fingerprint, term counts, length)
+        self.docs = {}
+        self.doc_freq = Counter()
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.docs
+
+    def add(self, doc_id, text):
+        """Add or replace a document; unchanged text is a no-op"""
+        fingerprint = stable_hash(text)
+        current = self.docs.get(doc_id)
+        if current is not None:
+            if current[0] == fingerprint:
+                return False
+            self.remove(doc_id)
+
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        self.docs[doc_id] = (fingerprint, counts, length)
+        self.doc_freq.update(counts.keys())
+        self.total_length += length
+        return True
+
+    def remove(self, doc_id):
+        entry = self.docs.pop(doc_id, None)
+        if entry is None:
+            return
+        _, counts, length = entry
+        self.doc_freq.subtract(counts.keys())
+        for term in counts:
+            if self.doc_freq[term] <= 0:
+                del self.doc_freq[term]
+        self.total_length -= length
+
+    def idf(self, term):
+        n = len(self.docs)
+        df = self.doc_freq.get(term, 0)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def score(self, doc_id, query_terms):
+        """BM25 score of one document for a list of query terms"""
+        entry = self.docs.get(doc_id)
+        if entry is None or not query_terms:
+            return 0.0
+        _, counts, length = entry
+        avg_length = self.total_length / len(self.docs) if self.docs else 0
+        norm = self.k1 * (1 - self.b + self.b * length / avg_length) if avg_length else self.k1
+
+        total = 0.0
+        for term, weight in Counter(query_terms).items():
+            tf = counts.get(term)
+            if tf:
+                total += weight * self.idf(term) * tf * (self.k1 + 1) / (tf + norm)
+        return total
+
+
+def jd_query_terms(jd_analysis):
+    """Query terms for a JD: skills and keywords (canonical names too) plus responsibilities"""
+    terms = []
+    for field in ('required_skills', 'nice_to_have_skills', 'keywords'):
+        for item in jd_analysis.get(field, []) or []:
+            terms.extend(tokenize(item))
+            canonical = normalize_skill(item)
+            if canonical and canonical != str(item).strip().lower():
+                terms.extend(tokenize(canonical))
+    # Required skills count twice, as in select_best_projects
+    for item in jd_analysis.get('required_skills', []) or []:
+        terms.extend(tokenize(item))
+    for item in jd_analysis.get('key_responsibilities', []) or []:
+        terms.extend(tokenize(item))
+    return terms
+
+
+def _project_text(project):
+    return ' '.join([
+        str(project.get('name', '')),
+        str(project.get('description', '')),
+        ' '.join(str(t) for t in project.get('tech_stack', []))
+    ])
+
+
+class ProfileRelevanceIndex:
+    """
+    BM25 documents for one profile: every project and every responsibility
+    bullet, updated incrementally as the profile changes.
+    """
+
+    def __init__(self, profile=None):
+        self.projects = BM25Index()
+        self.bullets = BM25Index()
+        if profile is not None:
+            self.sync(profile)
+
+    def sync_projects(self, projects):
+        """Re-index changed projects (keyed by position); returns documents re-tokenized"""
+        changed = sum(self.projects.add(i, _project_text(p)) for i, p in enumerate(projects))
+        for doc_id in list(self.projects.docs):
+            if doc_id >= len(projects):
+                self.projects.remove(doc_id)
+        return changed
+
+    def sync_bullets(self, experiences):
+        """
+        Re-index changed bullets; returns documents re-tokenized.
+        Bullets are keyed by their text, so reordering them or moving them
+        between roles costs nothing and duplicates share one document.
+        """
+        current = {resp for exp in experiences for resp in exp.get('responsibilities', [])}
+        changed = sum(self.bullets.add(resp, resp) for resp in current)
+        for doc_id in list(self.bullets.docs):
+            if doc_id not in current:
+                self.bullets.remove(doc_id)
+        return changed
+
+    def sync(self, profile):
+        """Bring the whole index in line with profile; returns documents re-tokenized"""
+        return (self.sync_projects(profile.get('projects', []))
+                + self.sync_bullets(profile.get('experience', [])))
+
+
+def scale_scores(scores, weight):
+    """Rescale raw scores so the best one is worth `weight` (all zeros stay zero)"""
+    best = max(scores, default=0)
+    if best <= 0:
+        return [0.0 for _ in scores]
+    return [weight * s / best for s in scores]
+
+
+# One index per process, re-synced on every call so an edited profile only
+# re-tokenizes what changed
+_shared_index = ProfileRelevanceIndex()
+_shared_lock = threading.Lock()
+
+
+def project_relevance(projects, query_terms):
+    """BM25 score for each project, in order"""
+    with _shared_lock:
+        _shared_index.sync_projects(projects)
+        return [_shared_index.projects.score(i, query_terms) for i in range(len(projects))]
+
+
+def bullet_relevance(experiences, query_terms):
+    """BM25 score for every bullet text across experiences"""
+    with _shared_lock:
+        _shared_index.sync_bullets(experiences)
+        return {doc_id: _shared_index.bullets.score(doc_id, query_terms)
+                for doc_id in _shared_index.bullets.docs}
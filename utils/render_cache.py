@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from utils.cache import MemoryLRUCache, stable_hash
+from utils.docx_builder import create_resume_docx
+from utils.html_resume_builder import create_html_resume, html_to_pdf
+
+# Shared by every session in this process; Streamlit keeps imported modules
+# alive across reruns, so identical inputs are rendered once
+RENDER_CACHE = MemoryLRUCache(
+    max_entries=int(os.getenv('RESUMEFORGE_RENDER_CACHE_SIZE', '32')),
+    max_bytes=int(os.getenv('RESUMEFORGE_RENDER_CACHE_MB', '64')) * 1024 * 1024
+)
+
+# Background renders requested from the page, off the Streamlit script thread
+RENDER_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='render')
+
+
+def render_key(profile, jd_analysis, tailored_summary, match_details, selected_projects, optimized_experiences):
+    """Stable hash of everything that affects the rendered resume"""
+    return stable_hash(profile, jd_analysis, tailored_summary, match_details,
+                       selected_projects, optimized_experiences)
+
+
+def _cached(kind, key, build):
+    cache_key = f"{kind}:{key}"
+    value = RENDER_CACHE.get(cache_key)
+    if value is None:
+        value = build()
+        if value is not None:
+            RENDER_CACHE.set(cache_key, value)
+    return value
+
+
+def render_html_cached(*render_args):
+    """create_html_resume, memoized on its inputs"""
+    return _cached('html', render_key(*render_args), lambda: create_html_resume(*render_args))
+
+
+def render_pdf_cached(*render_args):
+    """
+    html_to_pdf(create_html_resume(...)), memoized on the resume inputs
+    Returns: BytesIO with PDF bytes, or None if rendering failed (not cached)
+    """
+    def build():
+        pdf_file = html_to_pdf(render_html_cached(*render_args))
+        return pdf_file.getvalue() if pdf_file else None
+
+    pdf_bytes = _cached('pdf', render_key(*render_args), build)
+    return BytesIO(pdf_bytes) if pdf_bytes else None
+
+
+def render_docx_cached(*render_args):
+    """create_resume_docx, memoized on its inputs. Returns: BytesIO"""
+    docx_bytes = _cached('docx', render_key(*render_args), lambda: create_resume_docx(*render_args).getvalue())
+    return BytesIO(docx_bytes)
+
+
+def submit_render(fmt, *render_args):
+    """
+    Start rendering one download format ('pdf' or 'docx') in the background
+    Returns: Future resolving to the file bytes, or None if rendering failed
+    """
+    renderers = {'pdf': render_pdf_cached, 'docx': render_docx_cached}
+
+    def build():
+        try:
+            file_buffer = renderers[fmt](*render_args)
+        except Exception as e:
+            print(f"Error rendering {fmt.upper()}: {e}")
+            return None
+        return file_buffer.getvalue() if file_buffer else None
+
+    return RENDER_EXECUTOR.submit(build)
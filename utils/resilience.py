@@ -0,0 +1,250 @@
+"""
+Shared resilient-call layer for the LLM API.
+
+Every Cerebras call goes through resilient_call(endpoint, func, ...), which adds:
+
+- per-endpoint timeouts (passed to func as timeout=) and attempt limits
+- an optional deadline for the whole call: each attempt's timeout is cut
+  to the time left, and no retry starts that could not finish before it
+- exponential backoff with full jitter, honouring Retry-After
+- a process-wide retry budget, so retries cannot multiply load on an
+  upstream that is already struggling
+- a circuit breaker shared by all endpoints of the same upstream: after
+  repeated transient failures calls fail fast with CircuitOpenError for a
+  cool-down period instead of each Streamlit session blocking on timeouts
+
+Only transient errors (rate limits, 5xx, timeouts, dropped connections)
+are retried, and only outages (not rate limits) count against the breaker;
+a missing key or a bad request fails immediately.
+"""
+
+import os
+import random
+import threading
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+
+def status_code(error):
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status
+
+
+def is_rate_limited(error):
+    return status_code(error) == 429 or type(error).__name__ == 'RateLimitError'
+
+
+def is_retryable(error):
+    """Rate limits, 5xx responses, timeouts and dropped connections are worth retrying"""
+    if is_rate_limited(error):
+        return True
+    status = status_code(error)
+    if status is not None:
+        return status >= 500
+    return type(error).__name__ in (
+        'APIConnectionError', 'APITimeoutError', 'TimeoutError', 'ConnectionError',
+        'ReadTimeout', 'ConnectTimeout', 'RemoteProtocolError'
+    )
+
+
+def retry_after(error):
+    """Seconds requested by the server's Retry-After header, if any"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of calls: every call earns
+    `ratio` tokens, every retry spends one. `burst` tokens are available
+    up front so a quiet process can still retry.
+    """
+
+    def __init__(self, ratio=0.2, burst=10):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = float(burst)
+        self._lock = threading.Lock()
+
+    def record_call(self):
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self):
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive transient failures;
+    open -> half-open after `reset_timeout` seconds, when a single trial
+    call is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True if a call may go ahead now"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open':
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = 'half-open'
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == 'half-open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """A call ended with a non-transient error: says nothing about the upstream's health"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def retry_in(self):
+        """Seconds until an open circuit lets a trial call through"""
+        with self._lock:
+            if self.state != 'open':
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+
+class Endpoint:
+    """
+    Retry/timeout settings for one kind of call against an upstream:
+    timeout applies to each attempt, deadline (optional) to all attempts
+    and the backoff between them together
+    """
+
+    def __init__(self, name, timeout, max_attempts=3, base_delay=0.5, max_delay=8.0,
+                 breaker=None, budget=None, deadline=None):
+        self.name = name
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self.budget = budget
+
+    def backoff(self, attempt, error=None):
+        """Full-jitter exponential delay before retry number `attempt` (1-based)"""
+        delay = retry_after(error) if error is not None else None
+        if delay is not None:
+            return min(delay, self.max_delay * 4)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def resilient_call(endpoint, func, *args, max_attempts=None, before_attempt=None, wait=None, **kwargs):
+    """
+    Run func(*args, timeout=..., **kwargs) under the endpoint's breaker,
+    retry policy and budget. Each attempt gets the endpoint's timeout (or a
+    timeout= passed here), cut to what is left of the endpoint's deadline.
+    before_attempt() runs before every attempt and wait(error, delay)
+    replaces time.sleep between attempts (e.g. to pause a whole batch).
+    The number of attempts made is stored on a raised error as .attempts.
+    Raises: CircuitOpenError when the breaker refuses the call, otherwise
+    the last error from func
+    """
+    breaker = endpoint.breaker
+    budget = endpoint.budget
+    max_attempts = max_attempts or endpoint.max_attempts
+    attempt_timeout = kwargs.pop('timeout', None) or endpoint.timeout
+    deadline = time.monotonic() + endpoint.deadline if endpoint.deadline else None
+    if budget:
+        budget.record_call()
+
+    attempt = 0
+    while True:
+        if breaker and not breaker.allow():
+            error = CircuitOpenError(
+                f"{breaker.name} is unavailable (circuit open, retrying in {breaker.retry_in():.0f}s)"
+            )
+            error.attempts = attempt
+            raise error
+        if before_attempt:
+            before_attempt()
+        attempt += 1
+        timeout = attempt_timeout
+        if deadline is not None:
+            timeout = max(0.1, min(timeout or endpoint.deadline, deadline - time.monotonic()))
+        try:
+            if timeout is None:
+                result = func(*args, **kwargs)
+            else:
+                result = func(*args, timeout=timeout, **kwargs)
+        except Exception as e:
+            transient = is_retryable(e)
+            if breaker:
+                # A rate limit means the upstream is up; backoff handles it
+                if transient and not is_rate_limited(e):
+                    breaker.record_failure()
+                else:
+                    breaker.release()
+            e.attempts = attempt
+            if not transient or attempt >= max_attempts:
+                raise
+            delay = endpoint.backoff(attempt, e)
+            # A retry that would start at or after the deadline cannot finish in time
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise
+            if budget and not budget.try_spend():
+                raise
+            (wait or (lambda _error, seconds: time.sleep(seconds)))(e, delay)
+            continue
+        if breaker:
+            breaker.record_success()
+        return result
+
+
+# One breaker and budget for the Cerebras API, shared by every endpoint and session
+CEREBRAS_BREAKER = CircuitBreaker(
+    'Cerebras API',
+    failure_threshold=int(os.getenv('RESUMEFORGE_BREAKER_THRESHOLD', '5')),
+    reset_timeout=float(os.getenv('RESUMEFORGE_BREAKER_RESET', '30'))
+)
+CEREBRAS_RETRY_BUDGET = RetryBudget(
+    ratio=float(os.getenv('RESUMEFORGE_RETRY_RATIO', '0.2')),
+    burst=int(os.getenv('RESUMEFORGE_RETRY_BURST', '10'))
+)
+
+
+def cerebras_endpoint(name, timeout, max_attempts=3, deadline=None):
+    return Endpoint(name, timeout, max_attempts=max_attempts, deadline=deadline,
+                    breaker=CEREBRAS_BREAKER, budget=CEREBRAS_RETRY_BUDGET)
@@ -0,0 +1,93 @@
+"""
+Offline skill synonym / alias normalization.
+
+data/skill_aliases.json maps each canonical skill to its known variants
+("javascript": ["js", "ecmascript", ...]). At import the dictionary is
+compiled into a flat hash table from variant keys to canonical names, so a
+lookup is one or two dict hits: "React.js", "ReactJS" and "react js" all
+resolve to "react". Skills not in the dictionary keep their normalized
+spelling.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+ALIASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'skill_aliases.json')
+
+# Separators ignored when comparing variants ("node js" == "node.js" == "nodejs")
+_COMPACT_RE = re.compile(r'[\s.\-_/]+')
+
+
+def _variant_key(skill):
+    return ' '.join(str(skill).lower().split()).strip(' ,;:')
+
+
+def _compact_key(key):
+    compact = _COMPACT_RE.sub('', key)
+    # Keep keys that are only separators (e.g. ".") distinct from empty
+    return compact or key
+
+
+def load_alias_table(path=ALIASES_PATH):
+    """
+    Compile the alias dictionary into lookup tables
+    Returns: (exact: variant key -> canonical, compact: compact key -> canonical)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            aliases = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Could not load skill aliases from {path}: {e}")
+        aliases = {}
+
+    exact = {}
+    compact = {}
+    for canonical, variants in aliases.items():
+        canonical_key = _variant_key(canonical)
+        for variant in [canonical] + list(variants):
+            key = _variant_key(variant)
+            exact.setdefault(key, canonical_key)
+            compact.setdefault(_compact_key(key), canonical_key)
+    return exact, compact
+
+
+_EXACT_TABLE, _COMPACT_TABLE = load_alias_table()
+
+
+@lru_cache(maxsize=8192)
+def canonicalize_skill(skill):
+    """Canonical matching form of a skill name, e.g. 'Postgres' -> 'postgresql'"""
+    key = _variant_key(skill)
+    canonical = _EXACT_TABLE.get(key)
+    if canonical is None:
+        canonical = _COMPACT_TABLE.get(_compact_key(key), key)
+    return canonical
+
+
+def explain_skills(skills):
+    """
+    Inspect how raw skill names map to canonical ones
+    Returns: dict raw skill -> canonical skill for every input
+    """
+    return {skill: canonicalize_skill(skill) for skill in skills}
+
+
+def alias_mapping(skills):
+    """Only the skills an alias rewrote (beyond lowercasing), raw -> canonical"""
+    return {
+        skill: canonical
+        for skill, canonical in explain_skills(skills).items()
+        if canonical != _variant_key(skill)
+    }
+
+
+def skill_variants():
+    """Every known spelling (lowercased) -> canonical skill, e.g. for lexicon lookups"""
+    return dict(_EXACT_TABLE)
+
+
+def known_skills():
+    """All canonical skills in the dictionary"""
+    return sorted(set(_EXACT_TABLE.values()))
@@ -0,0 +1,87 @@
+"""
+Precomputed, normalized skill sets shared by the scorers and builders.
+
+Build a ProfileIndex once per profile and a JDIndex once per analysis, then
+pass them to calculate_match_score, generate_skill_recommendations,
+select_best_projects and the resume builders so none of them re-lowercase
+and re-set the same lists.
+
+Skills are normalized through the alias table in utils/skill_aliases.py, so
+"JS" and "JavaScript" land on the same entry.
+"""
+
+from utils.skill_aliases import alias_mapping, canonicalize_skill
+
+
+def normalize_skill(skill):
+    """Matching (canonical) form of a skill name"""
+    return canonicalize_skill(str(skill))
+
+
+def _normalized_set(skills):
+    return frozenset(normalize_skill(s) for s in skills if str(s).strip())
+
+
+def _display_map(skills):
+    # First spelling seen wins, e.g. 'python' -> 'Python'
+    display = {}
+    for skill in skills:
+        display.setdefault(normalize_skill(skill), skill)
+    return display
+
+
+class ProfileIndex:
+    """Normalized skills and project tech stacks for one profile"""
+
+    __slots__ = ('technical', 'soft', 'skills', 'display', 'aliases', 'project_stacks')
+
+    def __init__(self, profile):
+        skills = profile.get('skills', {})
+        technical = skills.get('technical', [])
+        soft = skills.get('soft', [])
+
+        self.technical = _normalized_set(technical)
+        self.soft = _normalized_set(soft)
+        self.skills = self.technical | self.soft
+        self.display = _display_map(list(technical) + list(soft))
+        self.aliases = alias_mapping(list(technical) + list(soft))
+        # Parallel to profile['projects']
+        self.project_stacks = [
+            _normalized_set(proj.get('tech_stack', []))
+            for proj in profile.get('projects', [])
+        ]
+
+
+class JDIndex:
+    """Normalized required / nice-to-have skills and keywords for one JD analysis"""
+
+    __slots__ = ('required', 'nice', 'all_skills', 'keywords', 'display', 'aliases')
+
+    def __init__(self, jd_analysis):
+        required = jd_analysis.get('required_skills', []) or []
+        nice = jd_analysis.get('nice_to_have_skills', []) or []
+
+        self.required = _normalized_set(required)
+        self.nice = _normalized_set(nice)
+        self.all_skills = self.required | self.nice
+        self.keywords = _normalized_set(jd_analysis.get('keywords', []) or [])
+        self.display = _display_map(list(required) + list(nice))
+        self.aliases = alias_mapping(list(required) + list(nice))
+
+
+def display_skills(normalized, index):
+    """Original spellings of some normalized skills, in the order the index listed them"""
+    return [name for key, name in index.display.items() if key in normalized]
+
+
+def matched_skill_set(match_details):
+    """Set of normalized matched skills for O(1) membership checks in builders"""
+    return _normalized_set(match_details.get('matched_skills', []))
+
+
+def order_skills_by_match(skills, match_details):
+    """Matched skills first (original order kept), then the rest"""
+    matched = matched_skill_set(match_details)
+    matched_skills = [s for s in skills if normalize_skill(s) in matched]
+    other_skills = [s for s in skills if normalize_skill(s) not in matched]
+    return matched_skills + other_skills, matched
@@ -1,38 +1,91 @@
+import time
 import trafilatura
-import requests
 from urllib.parse import urlparse
 
-def extract_from_url(url):
+from utils.http_cache import HTTP_CACHE, HTTP_OFFLINE, fetch_html
+from utils.job_extractors import MIN_TEXT_CHARS, run_extractors
+
+# Bump when extraction settings change so cached texts are re-extracted
+EXTRACTOR_VERSION = 2
+
+def extract_job_text(url, use_cache=True, offline=None, session=None):
     """
     Extract job description from URL.
-    Returns: (success: bool, text: str, error_message: str)
+    Pages and extracted texts are cached on disk (see utils/http_cache.py).
+    Site-specific extractors (utils/job_extractors.py) are tried before trafilatura.
+    Returns: dict with success, text, error, source (where the HTML came from),
+    extractor (which one produced the text, 'cache' if reused) and timings
+    (list of (extractor, seconds))
     """
+    result = {'success': False, 'text': "", 'error': "", 'source': None, 'extractor': None, 'timings': []}
     try:
         # Validate URL
         if not url.startswith(('http://', 'https://')):
-            return False, "", "Invalid URL. Please include http:// or https://"
+            result['error'] = "Invalid URL. Please include http:// or https://"
+            return result
         
-        # Fetch content
-        downloaded = trafilatura.fetch_url(url)
+        cache = HTTP_CACHE if use_cache else None
+        
+        # Fetch content (cached, revalidated with ETag/Last-Modified when stale)
+        fetched = fetch_html(url, cache=cache, offline=offline, session=session)
+        downloaded = fetched['html']
+        result['source'] = fetched['source']
         
         if not downloaded:
-            return False, "", "Couldn't fetch the webpage. Check if URL is correct."
+            if offline or (offline is None and HTTP_OFFLINE):
+                result['error'] = fetched['error']
+            elif fetched['aborted']:
+                result['error'] = f"{fetched['error']} Please try copy/paste instead."
+            else:
+                result['error'] = "Couldn't fetch the webpage. Check if URL is correct."
+            return result
+        
+        # Same HTML as last time: reuse the extracted text
+        if cache:
+            cached_text = cache.get_text(url, EXTRACTOR_VERSION)
+            if cached_text:
+                result.update(success=True, text=cached_text, extractor='cache')
+                return result
+        
+        # Known job boards / JSON-LD postings first: much cheaper than trafilatura
+        fast = run_extractors(downloaded, url)
+        result['timings'] = fast['timings']
+        text = fast['text']
+        result['extractor'] = fast['extractor']
         
-        # Extract main content
-        text = trafilatura.extract(
-            downloaded,
-            include_comments=False,
-            include_tables=True,
-            no_fallback=False
-        )
+        if not text:
+            # Extract main content
+            start = time.perf_counter()
+            text = trafilatura.extract(
+                downloaded,
+                include_comments=False,
+                include_tables=True,
+                no_fallback=False
+            )
+            result['timings'].append(('trafilatura', round(time.perf_counter() - start, 4)))
+            result['extractor'] = 'trafilatura'
         
-        if not text or len(text) < 100:
-            return False, "", "Couldn't extract job description. Please try copy/paste instead."
+        if not text or len(text) < MIN_TEXT_CHARS:
+            result['error'] = "Couldn't extract job description. Please try copy/paste instead."
+            return result
         
-        return True, text, ""
+        if cache:
+            cache.store_text(url, text, EXTRACTOR_VERSION)
+        
+        result.update(success=True, text=text)
+        return result
         
     except Exception as e:
-        return False, "", f"Error: {str(e)}"
+        result['error'] = f"Error: {str(e)}"
+        return result
+
+def extract_from_url(url, use_cache=True, offline=None):
+    """
+    Extract job description from URL.
+    Returns: (success: bool, text: str, error_message: str)
+    """
+    result = extract_job_text(url, use_cache=use_cache, offline=offline)
+    return result['success'], result['text'], result['error']
 
 def validate_url(url):
     """Check if URL is valid"""